@@ -6,13 +6,13 @@
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
 
-from importlib.metadata import version as metadata_version
-
 project = 'ENDF Python Interface'
 copyright = '2023, Paul Romano'
 author = 'Paul Romano'
 
-release = metadata_version('endf')
+# Use the version file written by setuptools-scm rather than querying the
+# installed package metadata
+from endf._version import __version__ as release
 version = '.'.join(release.split('.')[:2])
 
 # -- General configuration ---------------------------------------------------
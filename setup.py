@@ -1,9 +1,18 @@
 from setuptools import setup
 
-from pybind11.setup_helpers import build_ext, intree_extensions
+from pybind11.setup_helpers import ParallelCompile, build_ext, intree_extensions
 
+# Compile C++ sources in parallel. The number of jobs can be limited with the
+# ENDF_NUM_BUILD_JOBS environment variable and otherwise defaults to the number
+# of CPUs.
+ParallelCompile("ENDF_NUM_BUILD_JOBS", default=0).install()
 
-ext_modules = intree_extensions(["src/endf/_records.cpp"])
+ext_modules = intree_extensions([
+    "src/endf/_records.cpp",
+    "src/endf/_function.cpp",
+])
+for ext in ext_modules:
+    ext.cxx_std = 17
 
 setup(
     ext_modules=ext_modules,
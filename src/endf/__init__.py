@@ -1,17 +1,90 @@
 # SPDX-FileCopyrightText: 2023 Paul Romano
 # SPDX-License-Identifier: MIT
 
-from importlib.metadata import version, PackageNotFoundError
+from importlib import import_module
 
-from .material import *
-from .incident_neutron import *
-from .function import *
-from .product import *
-from .reaction import *
-from . import ace
+from .material import Material, get_materials
+from .function import Tabulated1D, Tabulated2D
+from .product import Product
 
 try:
-    __version__ = version("endf")
-except PackageNotFoundError:
+    # _version.py is generated by setuptools_scm at build time
+    from ._version import __version__
+except ImportError:
     # package is not installed
     pass
+
+# The high-level interface classes, the helpers they use and the section
+# parsers are only imported when first accessed so that users of the low-level
+# interface don't pay for importing them
+_LAZY_ATTRIBUTES = {
+    'IncidentNeutron': '.incident_neutron',
+    'SUM_RULES': '.incident_neutron',
+    'Reaction': '.reaction',
+    'REACTION_NAME': '.reaction',
+    'REACTION_MT': '.reaction',
+    'FISSION_MTS': '.reaction',
+    'AngleDistribution': '.mf4',
+    'EnergyDistribution': '.mf5',
+    'LevelInelastic': '.mf5',
+    'UncorrelatedAngleEnergy': '.mf6',
+    'Polynomial': 'numpy.polynomial',
+    'PathLike': '.fileutils',
+    'gnds_name': '.data',
+    'temperature_str': '.data',
+    'ATOMIC_SYMBOL': '.data',
+    'EV_PER_MEV': '.data',
+    # Section parsers
+    'parse_mf1_mt451': '.mf1',
+    'parse_mf1_mt452': '.mf1',
+    'parse_mf1_mt455': '.mf1',
+    'parse_mf1_mt458': '.mf1',
+    'parse_mf1_mt460': '.mf1',
+    'parse_mf2': '.mf2',
+    'parse_mf3': '.mf3',
+    'parse_mf4': '.mf4',
+    'parse_mf5': '.mf5',
+    'parse_mf6': '.mf6',
+    'parse_mf7_mt2': '.mf7',
+    'parse_mf7_mt4': '.mf7',
+    'parse_mf7_mt451': '.mf7',
+    'parse_mf8': '.mf8',
+    'parse_mf8_mt454': '.mf8',
+    'parse_mf8_mt457': '.mf8',
+    'parse_mf9_mf10': '.mf9',
+    'parse_mf12': '.mf12',
+    'parse_mf13': '.mf13',
+    'parse_mf14': '.mf14',
+    'parse_mf15': '.mf15',
+    'parse_mf23': '.mf23',
+    'parse_mf26': '.mf26',
+    'parse_mf27': '.mf27',
+    'parse_mf28': '.mf28',
+    'parse_mf33': '.mf33',
+    'parse_mf34': '.mf34',
+    'parse_mf40': '.mf40',
+}
+
+# Submodules that are only imported when first accessed
+_LAZY_SUBMODULES = {'ace', 'incident_neutron', 'reaction'}
+
+__all__ = [
+    'Material', 'get_materials', 'Tabulated1D', 'Tabulated2D', 'Product',
+    *_LAZY_SUBMODULES, *_LAZY_ATTRIBUTES
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name in _LAZY_SUBMODULES:
+        # Importing the submodule also binds it as an attribute of the package
+        return import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
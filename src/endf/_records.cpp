@@ -1,8 +1,15 @@
+#include <algorithm> // for fill, min
 #include <cstdlib>
-#include <cstring> // for strlen
+#include <cstring> // for strlen, strncmp
+#include <stdexcept>
+#include <string>
+#include <vector>
 
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 
+namespace py = pybind11;
+
 //! Convert string representation of a floating point number into a double
 //
 //! This function handles converting floating point numbers from an ENDF 11
@@ -12,19 +19,16 @@
 //! only whitespace is to be interpreted as a zero.
 //
 //! \param buffer character input from an ENDF file
+//! \param n Number of characters in the field (at most 11)
 //! \return Floating point number
 
-double cfloat_endf(const char* buffer)
+double cfloat_endf(const char* buffer, int n)
 {
   char arr[13]; // 11 characters plus e and a null terminator
   int j = 0; // current position in arr
   int found_significand = 0;
   int found_exponent = 0;
 
-  // limit n to 11 characters
-  int n = std::strlen(buffer);
-  if (n > 11) n = 11;
-
   for (int i = 0; i < n; ++i) {
     char c = buffer[i];
 
@@ -57,7 +61,254 @@ double cfloat_endf(const char* buffer)
   return std::atof(arr);
 }
 
+//! Convert a null-terminated ENDF floating point field into a double
+//
+//! \param buffer character input from an ENDF file
+//! \return Floating point number
+
+double cfloat_endf(const char* buffer)
+{
+  // limit n to 11 characters
+  int n = std::strlen(buffer);
+  if (n > 11) n = 11;
+  return cfloat_endf(buffer, n);
+}
+
+//! Convert the floating point fields on consecutive ENDF lines into an array
+//
+//! Each line holds up to six 11-character fields. Fields are read in order
+//! until the requested number of values has been converted; a field that is
+//! missing because a line is too short (or because the text ends early) is
+//! interpreted as zero.
+//
+//! \param text Lines from an ENDF file
+//! \param n Number of values to convert
+//! \return Array of values
+
+py::array_t<double> float_array(const std::string& text, py::ssize_t n)
+{
+  py::array_t<double> result(n);
+  double* out = result.mutable_data();
+
+  py::gil_scoped_release release;
+  py::ssize_t i = 0;
+  std::size_t pos = 0;
+  std::size_t size = text.size();
+  while (i < n && pos < size) {
+    std::size_t eol = text.find('\n', pos);
+    if (eol == std::string::npos) eol = size;
+    const char* line = text.data() + pos;
+    std::size_t length = eol - pos;
+    for (std::size_t j = 0; j < 6 && i < n; ++j) {
+      std::size_t start = std::min(11*j, length);
+      std::size_t width = std::min<std::size_t>(11, length - start);
+      out[i++] = cfloat_endf(line + start, width);
+    }
+    pos = eol + 1;
+  }
+  // Values beyond the end of the text are zero, as with a blank field
+  std::fill(out + i, out + n, 0.0);
+  return result;
+}
+
+//! Return pointer to a given column of a line
+//
+//! Columns are counted in characters rather than bytes so that lines
+//! containing multi-byte UTF-8 characters (e.g., in descriptive text) are
+//! handled correctly.
+//
+//! \param p Start of the line
+//! \param end End of the line
+//! \param col Zero-based column
+//! \return Pointer to the column or end of the line if it is too short
+
+const char* find_column(const char* p, const char* end, int col)
+{
+  for (int i = 0; i < col && p < end; ++i) {
+    ++p;
+    while (p < end && (*p & 0xC0) == 0x80) ++p;
+  }
+  return p;
+}
+
+//! Convert a fixed-width integer field (MAT, MF, or MT) into an int
+//
+//! Like Python's int(), leading/trailing spaces and a sign are allowed but a
+//! blank field is invalid.
+//
+//! \param begin Start of the field
+//! \param end End of the field
+//! \return Integer value
+
+int int_field(const char* begin, const char* end)
+{
+  const char* p = begin;
+  while (p < end && *p == ' ') ++p;
+  bool negative = false;
+  if (p < end && (*p == '+' || *p == '-')) {
+    negative = (*p == '-');
+    ++p;
+  }
+  if (p == end || *p < '0' || *p > '9') {
+    throw std::invalid_argument("Invalid integer field '" +
+      std::string(begin, end) + "' in ENDF record");
+  }
+  int value = 0;
+  while (p < end && *p >= '0' && *p <= '9') value = 10*value + (*p++ - '0');
+  while (p < end && *p == ' ') ++p;
+  if (p != end) {
+    throw std::invalid_argument("Invalid integer field '" +
+      std::string(begin, end) + "' in ENDF record");
+  }
+  return negative ? -value : value;
+}
+
+//! Convert the six fields of a CONT-like record
+//
+//! The first two fields are floating point numbers and the remaining four are
+//! integers. Integer fields that are blank (or missing because the line is too
+//! short) are interpreted as zero.
+//
+//! \param line Line from an ENDF file
+//! \return Tuple of the six fields
+
+py::tuple cont_record(const std::string& line)
+{
+  std::size_t length = line.size();
+  if (length > 0 && line[length - 1] == '\n') --length;
+  const char* p = line.data();
+  auto field = [&](std::size_t j, std::size_t& width) {
+    std::size_t start = std::min(11*j, length);
+    width = std::min<std::size_t>(11, length - start);
+    return p + start;
+  };
+
+  std::size_t width;
+  const char* f = field(0, width);
+  double C1 = cfloat_endf(f, width);
+  f = field(1, width);
+  double C2 = cfloat_endf(f, width);
+
+  int L[4];
+  for (std::size_t j = 0; j < 4; ++j) {
+    f = field(j + 2, width);
+    const char* end = f + width;
+    bool blank = std::all_of(f, end, [](char c) { return c == ' '; });
+    L[j] = blank ? 0 : int_field(f, end);
+  }
+  return py::make_tuple(C1, C2, L[0], L[1], L[2], L[3]);
+}
+
+//! Location of a section within the text of a material
+struct Section {
+  int MF;
+  int MT;
+  std::size_t begin;
+  std::size_t end;
+};
+
+//! Split the text of a material into sections
+//
+//! Lines at the start of the text with MF=0 are skipped. Each section starts
+//! at a record with MT > 0 and ends before the following SEND record. The
+//! material ends at the MEND record (MAT=0) or the end of the text.
+//
+//! \param text Text of an ENDF material
+//! \param sections Locations of each section within text
+//! \return MAT number of the material
+
+int split_sections(const std::string& text, std::vector<Section>& sections)
+{
+  int material = 0;
+  bool found_material = false;
+  bool in_section = false;
+  Section current {0, 0, 0, 0};
+
+  std::size_t pos = 0;
+  std::size_t n = text.size();
+  while (pos < n) {
+    std::size_t eol = text.find('\n', pos);
+    std::size_t next = (eol == std::string::npos) ? n : eol + 1;
+    const char* line = text.data() + pos;
+    const char* line_end = text.data() + std::min(eol, n);
+    const char* fields = find_column(line, line_end, 66);
+    std::size_t n_fields = line_end - fields;
+
+    if (in_section) {
+      // Check for SEND record
+      if (n_fields >= 9 && std::strncmp(fields + 6, "  0", 3) == 0) {
+        current.end = pos;
+        sections.push_back(current);
+        in_section = false;
+      }
+    } else {
+      int MF = int_field(fields + std::min<std::size_t>(4, n_fields),
+                         fields + std::min<std::size_t>(6, n_fields));
+
+      // Skip leading records with MF=0; the MAT number is determined from the
+      // first record with MF > 0
+      if (!found_material && MF == 0) {
+        pos = next;
+        continue;
+      }
+      int MAT = int_field(fields, fields + std::min<std::size_t>(4, n_fields));
+      int MT = int_field(fields + std::min<std::size_t>(6, n_fields),
+                         fields + std::min<std::size_t>(9, n_fields));
+      if (!found_material) {
+        material = MAT;
+        found_material = true;
+      }
+
+      // Check for MEND record
+      if (MAT == 0) break;
+
+      // Start of next section
+      if (MT > 0) {
+        current = {MF, MT, pos, 0};
+        in_section = true;
+      }
+    }
+    pos = next;
+  }
+
+  if (in_section) {
+    throw std::invalid_argument("ENDF material ended in the middle of MF=" +
+      std::to_string(current.MF) + ", MT=" + std::to_string(current.MT));
+  }
+  return material;
+}
+
+//! Split the text of an ENDF material into sections
+//
+//! \param text Text of an ENDF material ending with a MEND record
+//! \return Tuple of the MAT number and a dictionary mapping (MF, MT) to the
+//!   text of each section
+
+py::tuple split_material(const std::string& text)
+{
+  std::vector<Section> sections;
+  int material;
+  {
+    py::gil_scoped_release release;
+    material = split_sections(text, sections);
+  }
+
+  py::dict section_text;
+  for (const auto& s : sections) {
+    section_text[py::make_tuple(s.MF, s.MT)] =
+      py::str(text.data() + s.begin, s.end - s.begin);
+  }
+  return py::make_tuple(material, section_text);
+}
+
 PYBIND11_MODULE(_records, m) {
   m.doc() = "float_endf";
-  m.def("float_endf", &cfloat_endf, "Convert string to float");
+  m.def("float_endf", py::overload_cast<const char*>(&cfloat_endf),
+        "Convert string to float");
+  m.def("float_array", &float_array,
+        "Convert floating point fields on ENDF lines into an array");
+  m.def("cont_record", &cont_record,
+        "Convert the six fields of a CONT record");
+  m.def("split_material", &split_material,
+        "Split text of an ENDF material into sections");
 }
@@ -1,12 +1,13 @@
 # SPDX-FileCopyrightText: 2023 Paul Romano
 # SPDX-License-Identifier: MIT
 
-import re
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Tuple
 
 # Dictionary to give element symbols from IUPAC names
 # (and some common mispellings)
-ELEMENT_SYMBOL = {
+ELEMENT_SYMBOL = MappingProxyType({
     'neutron': 'n', 'hydrogen': 'H', 'helium': 'He',
     'lithium': 'Li', 'beryllium': 'Be', 'boron': 'B',
     'carbon': 'C', 'nitrogen': 'N', 'oxygen': 'O', 'fluorine': 'F',
@@ -47,9 +48,9 @@ ELEMENT_SYMBOL = {
     'darmstadtium': 'Ds', 'roentgenium': 'Rg', 'copernicium': 'Cn',
     'nihonium': 'Nh', 'flerovium': 'Fl', 'moscovium': 'Mc',
     'livermorium': 'Lv', 'tennessine': 'Ts', 'oganesson': 'Og'
-}
+})
 
-ATOMIC_SYMBOL = {
+ATOMIC_SYMBOL = MappingProxyType({
     0: 'n', 1: 'H', 2: 'He', 3: 'Li', 4: 'Be', 5: 'B', 6: 'C',
     7: 'N', 8: 'O', 9: 'F', 10: 'Ne', 11: 'Na', 12: 'Mg', 13: 'Al',
     14: 'Si', 15: 'P', 16: 'S', 17: 'Cl', 18: 'Ar', 19: 'K',
@@ -71,18 +72,20 @@ ATOMIC_SYMBOL = {
     108: 'Hs', 109: 'Mt', 110: 'Ds', 111: 'Rg', 112: 'Cn',
     113: 'Nh', 114: 'Fl', 115: 'Mc', 116: 'Lv', 117: 'Ts',
     118: 'Og'
-}
-ATOMIC_NUMBER = {value: key for key, value in ATOMIC_SYMBOL.items()}
+})
+ATOMIC_NUMBER = MappingProxyType(
+    {value: key for key, value in ATOMIC_SYMBOL.items()})
+
+# Atomic symbols indexed by atomic number for fast lookup in gnds_name
+_SYMBOLS = tuple(ATOMIC_SYMBOL[Z] for Z in range(len(ATOMIC_SYMBOL)))
 
 # Boltzmann constant in [eV/K]
 K_BOLTZMANN = 8.617333262e-5
 
 EV_PER_MEV = 1.0e6
 
-# Regex for GNDS nuclide names (used in zam function)
-_GNDS_NAME_RE = re.compile(r'([A-Zn][a-z]*)(\d+)((?:_[em]\d+)?)')
-
 
+@lru_cache(maxsize=None)
 def gnds_name(Z: int, A: int, m: int = 0) -> str:
     """Return nuclide name using GNDS convention
 
@@ -100,11 +103,20 @@ def gnds_name(Z: int, A: int, m: int = 0) -> str:
     Nuclide name in GNDS convention, e.g., 'Am242_m1'
 
     """
-    if m > 0:
-        return f'{ATOMIC_SYMBOL[Z]}{A}_m{m}'
-    return f'{ATOMIC_SYMBOL[Z]}{A}'
+    # Negative indices would silently wrap around, so they are rejected the
+    # same way as atomic numbers that are too large
+    if Z < 0:
+        raise KeyError(Z)
+    try:
+        symbol = _SYMBOLS[Z]
+    except (IndexError, TypeError):
+        raise KeyError(Z) from None
+    if m == 0:
+        return f'{symbol}{A}'
+    return f'{symbol}{A}_m{m}'
 
 
+@lru_cache(maxsize=4096)
 def zam(name: str) -> Tuple[int, int, int]:
     """Return tuple of (atomic number, mass number, metastable state)
 
@@ -118,17 +130,29 @@ def zam(name: str) -> Tuple[int, int, int]:
     Atomic number, mass number, and metastable state
 
     """
-    try:
-        symbol, A, state = _GNDS_NAME_RE.match(name).groups()
-    except AttributeError:
+    # Split name into symbol, mass number, and optional '_m' or '_e' suffix.
+    # This is done by hand since it is considerably faster than a regex match
+    # for short strings.
+    i = 0
+    n = len(name)
+    while i < n and not name[i].isdigit():
+        i += 1
+    symbol = name[:i]
+    j = name.find('_', i)
+    if j == -1:
+        A = name[i:]
+        state = '0'
+    else:
+        A = name[i:j]
+        state = name[j + 2:] if name[j + 1:j + 2] in ('e', 'm') else ''
+    if not (symbol and A.isdigit() and state.isdigit()):
         raise ValueError(f"'{name}' does not appear to be a nuclide name in "
                          "GNDS format")
 
     if symbol not in ATOMIC_NUMBER:
         raise ValueError(f"'{symbol}' is not a recognized element symbol")
 
-    metastable = int(state[2:]) if state else 0
-    return (ATOMIC_NUMBER[symbol], int(A), metastable)
+    return (ATOMIC_NUMBER[symbol], int(A), int(state))
 
 
 def temperature_str(T: float) -> str:
@@ -144,4 +168,4 @@ def temperature_str(T: float) -> str:
     String representation of temperature, e.g., '294K'
 
     """
-    return "{}K".format(int(round(T)))
+    return f'{round(T):.0f}K'
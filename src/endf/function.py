@@ -1,13 +1,57 @@
 # SPDX-FileCopyrightText: 2023 OpenMC contributors and Paul Romano
 # SPDX-License-Identifier: MIT
 
-from collections.abc import Iterable
-from math import exp, log
+from weakref import WeakValueDictionary
 
 import numpy as np
 
+from ._function import scalar_interpolator, integrate, eytzinger_layout, \
+    search_eytzinger
 from .data import EV_PER_MEV
 
+__all__ = ['Tabulated1D', 'Tabulated2D']
+
+# Minimum number of tabulated points for which bins are searched using a copy
+# of the tabulated x values in Eytzinger order
+_EYTZINGER_MIN_SIZE = 256
+
+# Read-only interpolation region arrays shared between tabulated functions
+_INTERNED_ARRAYS = WeakValueDictionary()
+
+
+def _intern(values) -> np.ndarray:
+    """Return a shared, read-only integer array equal to the given values.
+
+    Most tabulated functions have a single linear-linear interpolation region,
+    so sharing the arrays describing the regions avoids holding many identical
+    small arrays.
+
+    """
+    values = np.asarray(values, dtype=int)
+    key = values.tobytes()
+    array = _INTERNED_ARRAYS.get(key)
+    if array is None:
+        array = values.ravel().copy()
+        array.flags.writeable = False
+        _INTERNED_ARRAYS[key] = array
+    return array
+
+
+def _read_only(values, dtype=None) -> np.ndarray:
+    """Return a read-only array with the given values.
+
+    Tabulated functions cache lookup tables derived from their x and y values,
+    so the arrays they hold must not be modified in place. Writable arrays that
+    may still be referenced elsewhere are copied first.
+
+    """
+    array = np.asarray(values, dtype=dtype)
+    if array.flags.writeable:
+        if isinstance(values, np.ndarray) and np.may_share_memory(array, values):
+            array = array.copy()
+        array.flags.writeable = False
+    return array
+
 
 class Tabulated1D:
     """A one-dimensional tabulated function.
@@ -34,13 +78,19 @@ class Tabulated1D:
     interpolation : Iterable of int
         Interpolation scheme identification number, e.g., 3 means y is linear in
         ln(x).
+    dtype : numpy.dtype, optional
+        Data type used to store x and y, e.g., numpy.float32 to halve the memory
+        needed for large tables. By default, the data type is inferred from the
+        values given.
 
     Attributes
     ----------
-    x : Iterable of float
-        Independent variable
-    y : Iterable of float
-        Dependent variable
+    x : numpy.ndarray
+        Independent variable. The array is read-only; assign a new array to
+        change it.
+    y : numpy.ndarray
+        Dependent variable. The array is read-only; assign a new array to
+        change it.
     breakpoints : Iterable of int
         Breakpoints for interpolation regions
     interpolation : Iterable of int
@@ -53,115 +103,198 @@ class Tabulated1D:
 
     """
 
-    def __init__(self, x, y, breakpoints=None, interpolation=None):
+    def __init__(self, x, y, breakpoints=None, interpolation=None, dtype=None):
         if breakpoints is None or interpolation is None:
             # Single linear-linear interpolation region by default
-            self.breakpoints = np.array([len(x)])
-            self.interpolation = np.array([2])
+            self.breakpoints = [len(x)]
+            self.interpolation = [2]
         else:
-            self.breakpoints = np.asarray(breakpoints, dtype=int)
-            self.interpolation = np.asarray(interpolation, dtype=int)
+            self.breakpoints = breakpoints
+            self.interpolation = interpolation
 
-        self.x = np.asarray(x)
-        self.y = np.asarray(y)
+        self.x = _read_only(x, dtype)
+        self.y = _read_only(y, dtype)
 
     def __repr__(self):
         return f"<Tabulated1D: {self.x.size} points, {self.breakpoints.size} regions>"
 
+    def __getstate__(self):
+        # Cached lookup tables are rebuilt when needed rather than pickled
+        state = self.__dict__.copy()
+        state['_eytzinger'] = None
+        state['_slope_cache'] = {}
+        state['_interpolator'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # Unpickled arrays are new and only referenced here, but they are
+        # writable and the regions are no longer shared
+        self._x.flags.writeable = False
+        self._y.flags.writeable = False
+        self.breakpoints = self._breakpoints
+        self.interpolation = self._interpolation
+
     def __call__(self, x):
-        # Check if input is scalar
-        if not isinstance(x, Iterable):
+        # Check if input is scalar. The isinstance check avoids the relatively
+        # slow call to np.ndim for Python (and numpy.float64) values.
+        if isinstance(x, (float, int)) or np.ndim(x) == 0:
             return self._interpolate_scalar(x)
 
-        x = np.array(x)
-
-        # Create output array
-        y = np.zeros_like(x)
-
-        # Get indices for interpolation
-        idx = np.searchsorted(self.x, x, side='right') - 1
-
-        # Loop over interpolation regions
-        for k in range(len(self.breakpoints)):
-            # Get indices for the begining and ending of this region
-            i_begin = self.breakpoints[k-1] - 1 if k > 0 else 0
-            i_end = self.breakpoints[k] - 1
-
-            # Figure out which idx values lie within this region
-            contained = (idx >= i_begin) & (idx < i_end)
-
-            xk = x[contained]                 # x values in this region
-            xi = self.x[idx[contained]]       # low edge of corresponding bins
-            xi1 = self.x[idx[contained] + 1]  # high edge of corresponding bins
-            yi = self.y[idx[contained]]
-            yi1 = self.y[idx[contained] + 1]
-
-            if self.interpolation[k] == 1:
-                # Histogram
-                y[contained] = yi
-
-            elif self.interpolation[k] == 2:
-                # Linear-linear
-                y[contained] = yi + (xk - xi)/(xi1 - xi)*(yi1 - yi)
-
-            elif self.interpolation[k] == 3:
-                # Linear-log
-                y[contained] = yi + np.log(xk/xi)/np.log(xi1/xi)*(yi1 - yi)
-
-            elif self.interpolation[k] == 4:
-                # Log-linear
-                y[contained] = yi*np.exp((xk - xi)/(xi1 - xi)*np.log(yi1/yi))
-
-            elif self.interpolation[k] == 5:
-                # Log-log
-                y[contained] = (yi*np.exp(np.log(xk/xi)/np.log(xi1/xi)
-                                *np.log(yi1/yi)))
-
-        # In some cases, x values might be outside the tabulated region due only
-        # to precision, so we check if they're close and set them equal if so.
-        y[np.isclose(x, self.x[0], atol=1e-14)] = self.y[0]
-        y[np.isclose(x, self.x[-1], atol=1e-14)] = self.y[-1]
+        # Points are only read, so existing arrays are used without a copy
+        x = np.asarray(x)
+
+        # A single linear-linear region (e.g., any cross section from an ACE
+        # table) can be interpolated by numpy directly, which is fastest unless
+        # the points are unsorted and the table is large
+        eytzinger = self._use_eytzinger(x)
+        single_linear = (len(self.breakpoints) == 1 and
+                         self.interpolation[0] == 2)
+        if single_linear and not eytzinger:
+            return np.interp(x, self._x, self._y)
+
+        # Get indices for interpolation. Points outside of the tabulated range
+        # take the value at the nearest end of the range, as with
+        # numpy.interp. Comparing x directly (rather than checking idx) lets
+        # NaN values propagate.
+        idx = self._search(x, eytzinger) - 1
+        np.clip(idx, 0, len(self._x) - 2, out=idx)
+        below = x < self._x[0]
+        above = x >= self._x[-1]
+        outside = below | above
+        any_outside = outside.any()
+        if any_outside:
+            inside = ~outside
+            xk = x[inside]
+            idx = idx[inside]
+        else:
+            xk = x
 
+        if len(self.breakpoints) == 1:
+            values = self._interpolate_bins(self.interpolation[0], xk, idx)
+        else:
+            # Determine the interpolation scheme for each point and then
+            # interpolate all points that share a scheme at once
+            breakpoints = np.asarray(self.breakpoints)
+            region = np.searchsorted(breakpoints - 1, idx, side='right')
+            schemes = np.asarray(self.interpolation)[region]
+            values = np.empty(xk.shape)
+            for p in np.unique(schemes):
+                m = (schemes == p)
+                values[m] = self._interpolate_bins(p, xk[m], idx[m])
+
+        # Every point is written exactly once, so the output array doesn't need
+        # to be initialized
+        if not any_outside:
+            return values
+        y = np.empty(x.shape)
+        y[inside] = values
+        y[below] = self._y[0]
+        y[above] = self._y[-1]
         return y
 
-    def _interpolate_scalar(self, x):
-        if x <= self._x[0]:
-            return self._y[0]
-        elif x >= self._x[-1]:
-            return self._y[-1]
+    def _interpolate_bins(self, p, x, idx):
+        """Interpolate within tabulated bins using a given scheme
 
-        # Get the index for interpolation
-        idx = np.searchsorted(self._x, x, side='right') - 1
+        Parameters
+        ----------
+        p : int
+            Interpolation scheme identification number
+        x : numpy.ndarray
+            Values of the independent variable to interpolate at
+        idx : numpy.ndarray
+            Indices of the bins that the values of x lie within
 
-        # Loop over interpolation regions
-        for b, p in zip(self.breakpoints, self.interpolation):
-            if idx < b - 1:
-                break
+        Returns
+        -------
+        numpy.ndarray
+            Interpolated values
 
-        xi = self._x[idx]       # low edge of the corresponding bin
-        xi1 = self._x[idx + 1]  # high edge of the corresponding bin
+        """
+        xi = self._x[idx]  # low edge of corresponding bins
         yi = self._y[idx]
-        yi1 = self._y[idx + 1]
-
         if p == 1:
             # Histogram
             return yi
+        elif p not in (2, 3, 4, 5):
+            return np.zeros_like(x, dtype=float)
 
-        elif p == 2:
+        slope = self._slopes(p)[idx]
+        if p == 2:
             # Linear-linear
-            return yi + (x - xi)/(xi1 - xi)*(yi1 - yi)
-
+            return yi + (x - xi)*slope
         elif p == 3:
             # Linear-log
-            return yi + log(x/xi)/log(xi1/xi)*(yi1 - yi)
-
+            return yi + np.log(x/xi)*slope
         elif p == 4:
             # Log-linear
-            return yi*exp((x - xi)/(xi1 - xi)*log(yi1/yi))
-
-        elif p == 5:
+            return yi*np.exp((x - xi)*slope)
+        else:
             # Log-log
-            return yi*exp(log(x/xi)/log(xi1/xi)*log(yi1/yi))
+            return yi*np.exp(np.log(x/xi)*slope)
+
+    def _slopes(self, p):
+        """Return the slope of each bin for a given interpolation scheme
+
+        The slopes only depend on the tabulated values, so they are computed
+        once per scheme and reused on subsequent calls. The x and y arrays are
+        read-only, and assigning new ones clears the cache.
+
+        Parameters
+        ----------
+        p : {2, 3, 4, 5}
+            Interpolation scheme identification number
+
+        Returns
+        -------
+        numpy.ndarray
+            Slope of y (or ln(y)) with respect to x (or ln(x)) in each bin
+
+        """
+        if p not in self._slope_cache:
+            x, y = self._x, self._y
+            with np.errstate(divide='ignore', invalid='ignore'):
+                dx = np.log(x[1:]/x[:-1]) if p in (3, 5) else np.diff(x)
+                dy = np.log(y[1:]/y[:-1]) if p in (4, 5) else np.diff(y)
+                self._slope_cache[p] = dy/dx
+        return self._slope_cache[p]
+
+    def _use_eytzinger(self, x):
+        """Determine whether to search for bins in Eytzinger order
+
+        For large tables and unsorted values of x, searching a copy of the
+        tabulated x values in Eytzinger order is several times faster than
+        numpy.searchsorted since it makes better use of the cache. When x is
+        already sorted, numpy.searchsorted is faster.
+
+        """
+        if len(self._x) < _EYTZINGER_MIN_SIZE or x.size < 2:
+            return False
+        xf = x.ravel()
+        return not np.all(xf[1:] >= xf[:-1])
+
+    def _search(self, x, eytzinger=False):
+        """Find indices where values would be inserted to maintain order
+
+        This is equivalent to ``numpy.searchsorted(self.x, x, side='right')``.
+
+        """
+        if not eytzinger:
+            return np.searchsorted(self._x, x, side='right')
+
+        if self._eytzinger is None:
+            self._eytzinger = eytzinger_layout(self._x)
+        values, ranks = self._eytzinger
+        return search_eytzinger(values, ranks, len(self._x), x)
+
+    def _interpolate_scalar(self, x):
+        # The compiled interpolator holds on to the arrays so that they are
+        # only converted once rather than on every call. This relies on x and
+        # y being read-only; assigning new arrays discards the interpolator.
+        if self._interpolator is None:
+            self._interpolator = scalar_interpolator(
+                self._x, self._y, self._breakpoints, self._interpolation)
+        return self._interpolator(x)
 
     def __len__(self):
         return len(self.x)
@@ -192,19 +325,26 @@ class Tabulated1D:
 
     @x.setter
     def x(self, x):
-        self._x = x
+        self._x = _read_only(x)
+        self._eytzinger = None
+        self._slope_cache = {}
+        self._interpolator = None
 
     @y.setter
     def y(self, y):
-        self._y = y
+        self._y = _read_only(y)
+        self._slope_cache = {}
+        self._interpolator = None
 
     @breakpoints.setter
     def breakpoints(self, breakpoints):
-        self._breakpoints = breakpoints
+        self._breakpoints = _intern(breakpoints)
+        self._interpolator = None
 
     @interpolation.setter
     def interpolation(self, interpolation):
-        self._interpolation = interpolation
+        self._interpolation = _intern(interpolation)
+        self._interpolator = None
 
     def integral(self):
         """Integral of the tabulated function over its tabulated range.
@@ -216,51 +356,8 @@ class Tabulated1D:
             integrals from the bottom of the range to each tabulated point.
 
         """
-
-        # Create output array
-        partial_sum = np.zeros(len(self.x) - 1)
-
-        i_low = 0
-        for k in range(len(self.breakpoints)):
-            # Determine which x values are within this interpolation range
-            i_high = self.breakpoints[k] - 1
-
-            # Get x values and bounding (x,y) pairs
-            x0 = self.x[i_low:i_high]
-            x1 = self.x[i_low + 1:i_high + 1]
-            y0 = self.y[i_low:i_high]
-            y1 = self.y[i_low + 1:i_high + 1]
-
-            if self.interpolation[k] == 1:
-                # Histogram
-                partial_sum[i_low:i_high] = y0*(x1 - x0)
-
-            elif self.interpolation[k] == 2:
-                # Linear-linear
-                m = (y1 - y0)/(x1 - x0)
-                partial_sum[i_low:i_high] = (y0 - m*x0)*(x1 - x0) + \
-                                            m*(x1**2 - x0**2)/2
-
-            elif self.interpolation[k] == 3:
-                # Linear-log
-                logx = np.log(x1/x0)
-                m = (y1 - y0)/logx
-                partial_sum[i_low:i_high] = y0 + m*(x1*(logx - 1) + x0)
-
-            elif self.interpolation[k] == 4:
-                # Log-linear
-                m = np.log(y1/y0)/(x1 - x0)
-                partial_sum[i_low:i_high] = y0/m*(np.exp(m*(x1 - x0)) - 1)
-
-            elif self.interpolation[k] == 5:
-                # Log-log
-                m = np.log(y1/y0)/np.log(x1/x0)
-                partial_sum[i_low:i_high] = y0/((m + 1)*x0**m)*(
-                    x1**(m + 1) - x0**(m + 1))
-
-            i_low = i_high
-
-        return np.concatenate(([0.], np.cumsum(partial_sum)))
+        return integrate(self._x, self._y, self._breakpoints,
+                         self._interpolation)
 
     @classmethod
     def from_ace(cls, ace, idx=0, convert_units=True):
@@ -299,11 +396,11 @@ class Tabulated1D:
 
         # Get (x,y) pairs
         idx += 2*n_regions + 1
-        x = ace.xss[idx:idx + n_pairs].copy()
-        y = ace.xss[idx + n_pairs:idx + 2*n_pairs].copy()
-
         if convert_units:
-            x *= EV_PER_MEV
+            x = ace.xss[idx:idx + n_pairs]*EV_PER_MEV
+        else:
+            x = ace.xss[idx:idx + n_pairs].copy()
+        y = ace.xss[idx + n_pairs:idx + 2*n_pairs].copy()
 
         return Tabulated1D(x, y, breakpoints, interpolation)
 
@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: MIT
 
 from __future__ import annotations
-from typing import Union, List
+from functools import partial
+from types import MappingProxyType
+from typing import Dict, List, Optional, Union
 
 import numpy as np
 
@@ -14,25 +16,74 @@ from .reaction import Reaction, REACTION_MT
 from . import ace
 
 
-SUM_RULES = {
-    1: [2, 3],
-    3: [4, 5, 11, 16, 17, 22, 23, 24, 25, 27, 28, 29, 30, 32, 33, 34, 35,
+__all__ = ['IncidentNeutron']
+
+SUM_RULES = MappingProxyType({
+    1: (2, 3),
+    3: (4, 5, 11, 16, 17, 22, 23, 24, 25, 27, 28, 29, 30, 32, 33, 34, 35,
         36, 37, 41, 42, 44, 45, 152, 153, 154, 156, 157, 158, 159, 160,
         161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172,
         173, 174, 175, 176, 177, 178, 179, 180, 181, 183, 184, 185,
-        186, 187, 188, 189, 190, 194, 195, 196, 198, 199, 200],
-    4: list(range(50, 92)),
-    16: list(range(875, 892)),
-    18: [19, 20, 21, 38],
-    27: [18, 101],
-    101: [102, 103, 104, 105, 106, 107, 108, 109, 111, 112, 113, 114,
-        115, 116, 117, 155, 182, 191, 192, 193, 197],
-    103: list(range(600, 650)),
-    104: list(range(650, 700)),
-    105: list(range(700, 750)),
-    106: list(range(750, 800)),
-    107: list(range(800, 850))
-}
+        186, 187, 188, 189, 190, 194, 195, 196, 198, 199, 200),
+    4: tuple(range(50, 92)),
+    16: tuple(range(875, 892)),
+    18: (19, 20, 21, 38),
+    27: (18, 101),
+    101: (102, 103, 104, 105, 106, 107, 108, 109, 111, 112, 113, 114,
+        115, 116, 117, 155, 182, 191, 192, 193, 197),
+    103: tuple(range(600, 650)),
+    104: tuple(range(650, 700)),
+    105: tuple(range(700, 750)),
+    106: tuple(range(750, 800)),
+    107: tuple(range(800, 850))
+})
+
+
+def _children_first(rules) -> tuple:
+    """Order the keys of sum rules so that each comes after its components"""
+    order = []
+    visited = set()
+    for root in rules:
+        stack = [(root, False)]
+        while stack:
+            MT, expanded = stack.pop()
+            if expanded:
+                order.append(MT)
+            elif MT not in visited:
+                visited.add(MT)
+                stack.append((MT, True))
+                stack.extend((MT_i, False) for MT_i in rules[MT] if MT_i in rules)
+    return tuple(order)
+
+
+_SUM_RULES_ORDER = _children_first(SUM_RULES)
+
+
+def _heating_xs(strT: str, energy: np.ndarray, heating_number: np.ndarray,
+                total_xs: np.ndarray, dtype: Optional[np.dtype]) -> dict:
+    """Compute the heating cross section (MT=301) from ACE data
+
+    Parameters
+    ----------
+    strT
+        Temperature string used as the dictionary key
+    energy
+        Energy grid in [eV]
+    heating_number
+        Average heating number in [MeV]
+    total_xs
+        Total cross section in [b]
+    dtype
+        Data type used to store the cross section
+
+    Returns
+    -------
+    Cross section for MT=301 keyed by temperature
+
+    """
+    heating = heating_number*EV_PER_MEV
+    np.multiply(heating, total_xs, out=heating)
+    return {strT: Tabulated1D(energy, heating, dtype=dtype)}
 
 
 class IncidentNeutron:
@@ -110,7 +161,8 @@ class IncidentNeutron:
     def from_ace(
         cls,
         filename_or_table: Union[PathLike, ace.Table],
-        metastable_scheme: str = 'mcnp'
+        metastable_scheme: str = 'mcnp',
+        dtype: Optional[np.dtype] = None
     ) -> IncidentNeutron:
         """Generate incident neutron continuous-energy data from an ACE table
 
@@ -127,6 +179,10 @@ class IncidentNeutron:
             for a metastable nuclide except for Am242m, for which 95242 is
             metastable and 95642 (or 1095242 in newer libraries) is the ground
             state. For NNDC libraries, ZAID is given as 1000*Z + A + 100*m.
+        dtype
+            Data type used to store energies and cross sections, e.g.,
+            numpy.float32 to halve the memory needed. Defaults to the data type
+            of the ACE table.
 
         Returns
         -------
@@ -154,34 +210,42 @@ class IncidentNeutron:
         # Read energy grid
         n_energy = table.nxs[3]
         i = table.jxs[1]
-        energy = table.xss[i : i + n_energy]*EV_PER_MEV
+        energy = np.asarray(table.xss[i : i + n_energy]*EV_PER_MEV, dtype=dtype)
+
+        # Tabulated functions hold read-only arrays; making the grid read-only
+        # up front lets every reaction share it rather than a view of it
+        energy.flags.writeable = False
         total_xs = table.xss[i + n_energy : i + 2*n_energy]
         absorption_xs = table.xss[i + 2*n_energy : i + 3*n_energy]
-        heating_number = table.xss[i + 4*n_energy : i + 5*n_energy]*EV_PER_MEV
+        heating_number = table.xss[i + 4*n_energy : i + 5*n_energy]
 
         # Create redundant reaction for total (MT=1)
-        xs = {strT: Tabulated1D(energy, total_xs)}
+        xs = {strT: Tabulated1D(energy, total_xs, dtype=dtype)}
         data.reactions[1] = Reaction(1, xs, redundant=True)
 
         # Create redundant reaction for absorption (MT=101)
-        if np.count_nonzero(absorption_xs) > 0:
-            xs = {strT: Tabulated1D(energy, absorption_xs)}
+        if absorption_xs.any():
+            xs = {strT: Tabulated1D(energy, absorption_xs, dtype=dtype)}
             data.reactions[101] = Reaction(101, xs, redundant=True)
 
-        # Create redundant reaction for heating (MT=301)
-        xs = {strT: Tabulated1D(energy, heating_number*total_xs)}
-        data.reactions[301] = Reaction(301, xs, redundant=True)
+        # Create redundant reaction for heating (MT=301). The cross section is
+        # only computed if it is accessed since it is seldom needed.
+        heating = Reaction(301, redundant=True)
+        heating._defer_xs(partial(
+            _heating_xs, strT, energy, heating_number, total_xs, dtype))
+        data.reactions[301] = heating
 
         # Read each reaction
         n_reaction = table.nxs[4] + 1
         for i in range(n_reaction):
-            rx = Reaction.from_ace(table, i)
+            rx = Reaction.from_ace(table, i, energy, dtype)
             data.reactions[rx.MT] = rx
 
         # Make sure redundant cross sections that are present in an ACE file get
         # marked as such
+        components = data._sum_rule_components()
         for rx in data:
-            mts = data._get_reaction_components(rx.MT)
+            mts = data._get_reaction_components(rx.MT, components)
             if mts != [rx.MT]:
                 rx.redundant = True
             if rx.MT in (203, 204, 205, 206, 207, 444):
@@ -223,13 +287,45 @@ class IncidentNeutron:
     def atomic_symbol(self) -> str:
         return ATOMIC_SYMBOL[self.atomic_number]
 
-    def _get_reaction_components(self, MT: int) -> List[int]:
+    def _sum_rule_components(self) -> Dict[int, List[int]]:
+        """Determine the components of every reaction that has a sum rule.
+
+        The sum rules are expanded without recursion by visiting each
+        redundant reaction after all of its components.
+
+        Returns
+        -------
+        dict
+            Mapping of MT for each reaction in SUM_RULES to the ENDF MT numbers
+            of reactions that make it up and have cross sections provided.
+
+        """
+        components = {}
+        for MT in _SUM_RULES_ORDER:
+            mts = []
+            for MT_i in SUM_RULES[MT]:
+                if MT_i in components:
+                    mts.extend(components[MT_i])
+                elif MT_i in self:
+                    mts.append(MT_i)
+            if not mts and MT in self:
+                mts.append(MT)
+            # Remove duplicates while preserving order
+            components[MT] = list(dict.fromkeys(mts))
+        return components
+
+    def _get_reaction_components(self, MT: int, components: Optional[dict] = None) -> List[int]:
         """Determine what reactions make up redundant reaction.
 
         Parameters
         ----------
         mt : int
             ENDF MT number of the reaction to find components of.
+        components : dict, optional
+            Result of :meth:`_sum_rule_components`. When determining components
+            for many reactions, passing it avoids expanding the sum rules
+            repeatedly. It is only valid as long as the set of reactions
+            doesn't change.
 
         Returns
         -------
@@ -238,11 +334,8 @@ class IncidentNeutron:
             have cross sections provided.
 
         """
-        mts = []
-        if MT in SUM_RULES:
-            for MT_i in SUM_RULES[MT]:
-                mts += self._get_reaction_components(MT_i)
-        if mts:
-            return mts
-        else:
-            return [MT] if MT in self else []
+        if components is None:
+            components = self._sum_rule_components()
+        if MT in components:
+            return components[MT]
+        return [MT] if MT in self else []
@@ -9,11 +9,21 @@ Nuclear Data Files". The version from January 2018 can be found at
 https://doi.org/10.2172/1425114.
 
 """
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 import io
-from typing import List, Tuple, Any, Union, TextIO, Optional
+import locale
+import mmap
+import os
+from types import MappingProxyType
+from typing import List, Tuple, Any, Union, TextIO, Optional, Iterator
 from warnings import warn
 
+import numpy as np
+
 import endf
+from ._records import split_material
 from .fileutils import PathLike
 from .mf1 import parse_mf1_mt451, parse_mf1_mt452, parse_mf1_mt455, \
     parse_mf1_mt458, parse_mf1_mt460
@@ -24,7 +34,7 @@ from .mf5 import parse_mf5
 from .mf6 import parse_mf6
 from .mf7 import parse_mf7_mt2, parse_mf7_mt4, parse_mf7_mt451
 from .mf8 import parse_mf8, parse_mf8_mt454, parse_mf8_mt457
-from .mf9 import parse_mf9_mf10
+from .mf9 import parse_mf9, parse_mf10
 from .mf12 import parse_mf12
 from .mf13 import parse_mf13
 from .mf14 import parse_mf14
@@ -38,7 +48,9 @@ from .mf34 import parse_mf34
 from .mf40 import parse_mf40
 
 
-_LIBRARY = {
+__all__ = ['Material', 'get_materials']
+
+_LIBRARY = MappingProxyType({
     0: 'ENDF/B',
     1: 'ENDF/A',
     2: 'JEFF',
@@ -58,9 +70,9 @@ _LIBRARY = {
     37: 'FENDL/A',
     38: 'IAEA/PD',
     41: 'BROND'
-}
+})
 
-_SUBLIBRARY = {
+_SUBLIBRARY = MappingProxyType({
     0: 'Photo-nuclear data',
     1: 'Photo-induced fission product yields',
     3: 'Photo-atomic data',
@@ -78,9 +90,134 @@ _SUBLIBRARY = {
     10030: 'Incident-triton data',
     20030: 'Incident-helion (3He) data',
     20040: 'Incident-alpha data'
+})
+
+# Parsers for specific (MF, MT) sections
+_SECTION_PARSERS = {
+    (1, 451): parse_mf1_mt451,
+    (1, 452): parse_mf1_mt452,
+    (1, 455): parse_mf1_mt455,
+    (1, 456): parse_mf1_mt452,
+    (1, 458): parse_mf1_mt458,
+    (1, 460): parse_mf1_mt460,
+    (2, 151): parse_mf2,
+    (7, 2): parse_mf7_mt2,
+    (7, 4): parse_mf7_mt4,
+    (7, 451): parse_mf7_mt451,
+    (8, 454): parse_mf8_mt454,
+    (8, 457): parse_mf8_mt457,
+    (8, 459): parse_mf8_mt454,
+}
+
+# Parsers used for any section within a given file (MF) that doesn't have an
+# entry in _SECTION_PARSERS
+_FILE_PARSERS = {
+    3: parse_mf3,
+    4: parse_mf4,
+    5: parse_mf5,
+    6: parse_mf6,
+    8: parse_mf8,
+    9: parse_mf9,
+    10: parse_mf10,
+    12: parse_mf12,
+    13: parse_mf13,
+    14: parse_mf14,
+    15: parse_mf15,
+    23: parse_mf23,
+    26: parse_mf26,
+    27: parse_mf27,
+    28: parse_mf28,
+    33: parse_mf33,
+    34: parse_mf34,
+    40: parse_mf40,
 }
 
 
+def _decode(data: bytes, encoding: Optional[str] = None) -> str:
+    """Decode raw bytes read from an ENDF file into text
+
+    Parameters
+    ----------
+    data
+        Bytes read from an ENDF file opened in binary mode
+    encoding
+        Encoding of the ENDF-6 formatted file. Defaults to the same encoding
+        that :func:`open` would use in text mode.
+
+    Returns
+    -------
+    Decoded text with universal newlines
+
+    """
+    if encoding is None:
+        encoding = locale.getpreferredencoding(False)
+    text = data.decode(encoding)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+@contextmanager
+def _map_file(filename: PathLike) -> Iterator[Union[mmap.mmap, bytes]]:
+    """Memory-map an ENDF file for reading
+
+    Mapping the file avoids copying its entire contents into memory when only
+    parts of it are decoded.
+
+    Parameters
+    ----------
+    filename
+        Path to ENDF-6 formatted file
+
+    Yields
+    ------
+    Read-only contents of the file
+
+    """
+    with open(str(filename), 'rb') as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            # Empty files can't be mapped
+            yield b''
+        else:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                yield data
+
+
+def _material_spans(data: Union[mmap.mmap, bytes]) -> List[Tuple[int, int]]:
+    """Locate each material within the raw contents of an ENDF file
+
+    Parameters
+    ----------
+    data
+        Contents of an ENDF file starting with a TPID record
+
+    Returns
+    -------
+    Start and end positions of each material, including its MEND record
+
+    """
+    # Find the position of every line and look at the MAT field (columns
+    # 67-70) of all lines at once to locate MEND and TEND records
+    buf = np.frombuffer(data, dtype=np.uint8)
+    ends = np.flatnonzero(buf == ord('\n'))
+    if ends.size == 0:
+        return []
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    full = np.flatnonzero(starts + 70 <= ends)
+    mat_field = buf[starts[full, np.newaxis] + np.arange(66, 70)]
+    mend = full[(mat_field == np.frombuffer(b'   0', np.uint8)).all(axis=1)]
+    tend = full[(mat_field == np.frombuffer(b'  -1', np.uint8)).all(axis=1)]
+    if tend.size > 0:
+        mend = mend[mend < tend[0]]
+
+    # Materials follow one another starting after the TPID record
+    spans = []
+    start = ends[0] + 1
+    for i in mend[mend > 0]:
+        spans.append((start, ends[i] + 1))
+        start = ends[i] + 1
+    return spans
+
 
 class Material:
     """ENDF material with multiple files/sections
@@ -103,7 +240,9 @@ class Material:
         Dictionary mapping (MF, MT) to corresponding section of the ENDF file.
     section_data
         Dictionary mapping (MF, MT) to a dictionary representing the
-        corresponding section of the ENDF file.
+        corresponding section of the ENDF file. Sections are parsed the first
+        time they are accessed by indexing the material, so accessing this
+        attribute parses every remaining section.
 
     """
     # TODO: Remove need to list properties here
@@ -114,130 +253,103 @@ class Material:
 
     def __init__(self, filename_or_obj: Union[PathLike, TextIO], encoding: Optional[str] = None):
         if isinstance(filename_or_obj, PathLike.__args__):
-            fh = open(str(filename_or_obj), 'r', encoding=encoding)
-            need_to_close = True
-        else:
-            fh = filename_or_obj
-            need_to_close = False
-        self.section_text = {}
+            # ENDF files are plain ASCII, so map the whole file as raw bytes
+            # and decode only the first material
+            with _map_file(filename_or_obj) as data:
+                spans = _material_spans(data)
+                if spans:
+                    start, end = spans[0]
+                else:
+                    # Without a MEND record, the material extends to the end of
+                    # the file
+                    start, end = data.find(b'\n') + 1, len(data)
+                text = _decode(data[start:end], encoding)
+            self._read_sections(text)
+            return
+
+        fh = filename_or_obj
 
         # Skip TPID record. Evaluators sometimes put in TPID records that are
         # ill-formated because they lack MF/MT values or put them in the wrong
         # columns.
         if fh.tell() == 0:
             fh.readline()
-        MF = 0
-
-        # Determine MAT number for this material
-        while MF == 0:
-            position = fh.tell()
-            line = fh.readline()
-            MF = int(line[70:72])
-        self.MAT = int(line[66:70])
-        fh.seek(position)
 
+        # Read all lines in the material up to and including the MEND record
+        lines = []
         while True:
-            # Find next section
-            while True:
-                position = fh.tell()
-                line = fh.readline()
-                MAT = int(line[66:70])
-                MF = int(line[70:72])
-                MT = int(line[72:75])
-                if MT > 0 or MAT == 0:
-                    fh.seek(position)
-                    break
-
-            # If end of material reached, exit loop
-            if MAT == 0:
-                fh.readline()
+            line = fh.readline()
+            lines.append(line)
+            if not line or line[66:70] == '   0':
                 break
+        self._read_sections(''.join(lines))
 
-            section_text = ''
-            while True:
-                line = fh.readline()
-                if line[72:75] == '  0':
-                    break
-                else:
-                    section_text += line
-            self.section_text[MF, MT] = section_text
-
-        if need_to_close:
-            fh.close()
-
-        self.section_data = {}
-        for (MF, MT), text in self.section_text.items():
-            file_obj = io.StringIO(text)
-            if MF == 1 and MT == 451:
-                self.section_data[MF, MT] = parse_mf1_mt451(file_obj)
-            elif MF == 1 and MT in (452, 456):
-                self.section_data[MF, MT] = parse_mf1_mt452(file_obj)
-            elif MF == 1 and MT == 455:
-                self.section_data[MF, MT] = parse_mf1_mt455(file_obj)
-            elif MF == 1 and MT == 458:
-                self.section_data[MF, MT] = parse_mf1_mt458(file_obj)
-            elif MF == 1 and MT == 460:
-                self.section_data[MF, MT] = parse_mf1_mt460(file_obj)
-            elif MF == 2 and MT == 151:
-                self.section_data[MF, MT] = parse_mf2(file_obj)
-            elif MF == 3:
-                self.section_data[MF, MT] = parse_mf3(file_obj)
-            elif MF == 4:
-                self.section_data[MF, MT] = parse_mf4(file_obj)
-            elif MF == 5:
-                self.section_data[MF, MT] = parse_mf5(file_obj)
-            elif MF == 6:
-                self.section_data[MF, MT] = parse_mf6(file_obj)
-            elif MF == 7 and MT == 2:
-                self.section_data[MF, MT] = parse_mf7_mt2(file_obj)
-            elif MF == 7 and MT == 4:
-                self.section_data[MF, MT] = parse_mf7_mt4(file_obj)
-            elif MF == 7 and MT == 451:
-                self.section_data[MF, MT] = parse_mf7_mt451(file_obj)
-            elif MF == 8 and MT in (454, 459):
-                self.section_data[MF, MT] = parse_mf8_mt454(file_obj)
-            elif MF == 8 and MT == 457:
-                self.section_data[MF, MT] = parse_mf8_mt457(file_obj)
-            elif MF == 8:
-                self.section_data[MF, MT] = parse_mf8(file_obj)
-            elif MF in (9, 10):
-                self.section_data[MF, MT] = parse_mf9_mf10(file_obj, MF)
-            elif MF == 12:
-                self.section_data[MF, MT] = parse_mf12(file_obj)
-            elif MF == 13:
-                self.section_data[MF, MT] = parse_mf13(file_obj)
-            elif MF == 14:
-                self.section_data[MF, MT] = parse_mf14(file_obj)
-            elif MF == 15:
-                self.section_data[MF, MT] = parse_mf15(file_obj)
-            elif MF == 23:
-                self.section_data[MF, MT] = parse_mf23(file_obj)
-            elif MF == 26:
-                self.section_data[MF, MT] = parse_mf26(file_obj)
-            elif MF == 27:
-                self.section_data[MF, MT] = parse_mf27(file_obj)
-            elif MF == 28:
-                self.section_data[MF, MT] = parse_mf28(file_obj)
-            elif MF == 33:
-                self.section_data[MF, MT] = parse_mf33(file_obj)
-            elif MF == 34:
-                self.section_data[MF, MT] = parse_mf34(file_obj, MT)
-            elif MF == 40:
-                self.section_data[MF, MT] = parse_mf40(file_obj)
-            else:
+    @classmethod
+    def _from_text(cls, text: str) -> Material:
+        """Create material from the text of a single ENDF material"""
+        material = cls.__new__(cls)
+        material._read_sections(text)
+        return material
+
+    def _read_sections(self, text: str):
+        """Split the text of a material into sections and parse each section
+
+        Parameters
+        ----------
+        text
+            Text of an ENDF material ending with a MEND record
+
+        """
+        # Determine MAT number and split the material into sections
+        self.MAT, self.section_text = split_material(text)
+
+        # Sections are parsed the first time they are accessed
+        self._section_data = {}
+        self._parsers = {}
+        for key in self.section_text:
+            MF, MT = key
+            parser = _SECTION_PARSERS.get(key) or _FILE_PARSERS.get(MF)
+            if parser is None:
                 warn(f"{MF=}, {MT=} ignored")
+            else:
+                self._parsers[key] = parser
+
+    def _parse_section(self, key: Tuple[int, int]) -> dict:
+        """Parse a section that has not been accessed yet"""
+        MF, MT = key
+        parser = self._parsers[key]
+
+        # StringIO.readline is implemented in C and is faster than any
+        # pure-Python reader over a list of lines
+        file_obj = io.StringIO(self.section_text[key])
+        if MF == 34:
+            data = parser(file_obj, MT)
+        else:
+            data = parser(file_obj)
+        self._section_data[key] = data
+
+        # Only forget the parser once parsing has succeeded so that a failed
+        # section can still be accessed again
+        del self._parsers[key]
+        return data
 
     def __contains__(self, mf_mt: Tuple[int, int]) -> bool:
-        return mf_mt in self.section_data
+        return mf_mt in self._section_data or mf_mt in self._parsers
 
     def __getitem__(self, mf_mt: Tuple[int, int]) -> dict:
-        return self.section_data[mf_mt]
+        try:
+            return self._section_data[mf_mt]
+        except KeyError:
+            if mf_mt not in self._parsers:
+                raise
+        return self._parse_section(mf_mt)
 
     def __setitem__(self, key: Tuple[int, int], value):
-        self.section_data[key] = value
+        self._parsers.pop(key, None)
+        self._section_data[key] = value
 
     def __repr__(self) -> str:
-        metadata = self.section_data[1, 451]
+        metadata = self[1, 451]
         name = metadata['ZSYMAM'].replace(' ', '')
         return '<{} for {} {}>'.format(_SUBLIBRARY[metadata['NSUB']], name,
                                        _LIBRARY[metadata['NLIB']])
@@ -246,6 +358,19 @@ class Material:
     def sections(self) -> List[Tuple[int, int]]:
         return list(self.section_text.keys())
 
+    @property
+    def section_data(self) -> dict:
+        if self._parsers:
+            # Parse any sections that haven't been accessed yet and put them
+            # back in the order they appear in the file
+            for key in list(self._parsers):
+                self._parse_section(key)
+            data = self._section_data
+            self._section_data = {key: data.pop(key)
+                                  for key in self.section_text if key in data}
+            self._section_data.update(data)
+        return self._section_data
+
     def interpret(self) -> Any:
         """Get high-level interface class for the ENDF material
 
@@ -255,14 +380,18 @@ class Material:
         :class:`endf.IncidentNeutron`.
 
         """
-        NSUB = self.section_data[1, 451]['NSUB']
+        NSUB = self[1, 451]['NSUB']
         if NSUB == 10:
             return endf.IncidentNeutron.from_endf(self)
         else:
             raise NotImplementedError(f"No class implemented for {NSUB=}")
 
 
-def get_materials(filename: PathLike, encoding: Optional[str] = None) -> List[Material]:
+def get_materials(
+    filename: PathLike,
+    encoding: Optional[str] = None,
+    max_workers: Optional[int] = 1
+) -> List[Material]:
     """Return a list of all materials within an ENDF file.
 
     Parameters
@@ -271,19 +400,35 @@ def get_materials(filename: PathLike, encoding: Optional[str] = None) -> List[Ma
         Path to ENDF-6 formatted file
     encoding
         Encoding of the ENDF-6 formatted file
+    max_workers
+        Maximum number of processes used to parse materials in parallel. When
+        more than one process is used, every section of each material is parsed
+        up front in the worker processes. By default, materials are read
+        serially and their sections are parsed when first accessed. If None,
+        the number of processors on the machine is used.
 
     Returns
     -------
     A list of ENDF materials
 
     """
-    materials = []
-    with open(str(filename), 'r', encoding=encoding) as fh:
-        while True:
-            pos = fh.tell()
-            line = fh.readline()
-            if line[66:70] == '  -1':
-                break
-            fh.seek(pos)
-            materials.append(Material(fh))
-    return materials
+    # Scan the entire file at once rather than line-by-line
+    with _map_file(filename) as data:
+        texts = [_decode(data[start:end], encoding)
+                 for start, end in _material_spans(data)]
+    if max_workers == 1 or len(texts) < 2:
+        return [Material._from_text(text) for text in texts]
+
+    # Materials are independent of one another, so all of their sections are
+    # parsed in separate processes. Individual sections are not worth
+    # distributing since sending the parsed data back costs about as much as
+    # parsing it.
+    with ProcessPoolExecutor(max_workers) as executor:
+        return list(executor.map(_parse_material, texts))
+
+
+def _parse_material(text: str) -> Material:
+    """Create a material and parse all of its sections"""
+    material = Material._from_text(text)
+    material.section_data
+    return material
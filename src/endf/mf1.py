@@ -177,11 +177,12 @@ def parse_mf1_mt458(file_obj: TextIO) -> dict:
 
     components = ('EFR', 'ENP', 'END', 'EGP', 'EGD', 'EB', 'ENU', 'ER', 'ET')
 
-    # Associate each set of values and uncertainties with its label.
+    # Associate each set of values and uncertainties with its label. Each
+    # component is an array with a (value, uncertainty) row per polynomial
+    # order.
+    values = values.reshape(-1, len(components), 2)
     for i, name in enumerate(components):
-        coeffs = values[2*i::18]
-        deltas = values[2*i + 1::18]
-        data[name] = list(zip(coeffs, deltas))
+        data[name] = values[:, i]
 
     # Check for tabulated data
     if LFC == 1:
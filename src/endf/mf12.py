@@ -45,14 +45,11 @@ def parse_mf12(file_obj: TextIO) -> dict:
         data['ES_NS'] = ES_NS
         data['LP'] = LP
         data['NT'] = NT
-        data['transitions'] = transition = []
-        for i in range(NT):
-            if LG == 1:
-                ES, TP = values[2*i : 2*(i + 1)]
-                transition.append({'ES': ES, 'TP': TP})
-            elif LG == 2:
-                ES, TP, GP = values[3*i : 3*(i + 1)]
-                transition.append({'ES': ES, 'TP': TP, 'GP': GP})
+        # Each transition has a row of (ES, TP) values, plus GP for complex
+        # transitions
+        keys = ('ES', 'TP', 'GP')[:LG + 1]
+        rows = values[:NT*len(keys)].reshape(NT, len(keys))
+        data['transitions'] = [dict(zip(keys, row)) for row in rows]
     else:
         warn(f"Unrecognized LO value: {LO}")
 
@@ -3,8 +3,6 @@
 
 from typing import TextIO
 
-import numpy as np
-
 from .records import get_head_record, get_cont_record, get_tab1_record, \
     get_list_record
 
@@ -170,14 +168,12 @@ class RMatrixLimited:
             (*_, NRS, _, NX), values = get_list_record(file_obj)
             spin_group['NRS'] = NRS
             spin_group['NX'] = NX
-            spin_group['ER'] = values[::NCH + 1]
-
-            # Read widths into a matrix and transpose
-            GAM = []
-            for j in range(NRS):
-                GAM.append(values[1 + (NCH + 1)*j:(NCH + 1)*(j + 1)])
-            GAM = np.array(GAM).reshape(NRS, NCH)
-            spin_group['GAM'] = GAM.T
+
+            # Each resonance has an energy followed by a width for each
+            # channel. Widths are stored with one row per channel.
+            resonances = values[:NRS*(NCH + 1)].reshape(NRS, NCH + 1)
+            spin_group['ER'] = resonances[:, 0]
+            spin_group['GAM'] = resonances[:, 1:].T
 
             # Optional extension (Background R-Matrix)
             if KBK > 0:
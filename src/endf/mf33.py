@@ -3,6 +3,8 @@
 
 from typing import TextIO
 
+import numpy as np
+
 from .records import get_head_record, get_cont_record, get_list_record
 
 
@@ -32,47 +34,76 @@ def parse_mf33_subsection(file_obj) -> dict:
 
     subsection['ni_subsections'] = []
     for _ in range(NI):
-        # Look ahead to determine LB
-        pos = file_obj.tell()
-        LB = get_cont_record(file_obj)[3]
-        file_obj.seek(pos)
-
-        if 0 <= LB <= 4:
-            (_, _, LT, LB, NT, NP), values = get_list_record(file_obj)
-            subsub = {'LT': LT, 'LB': LB, 'NT': NT, 'NP': NP}
-            k_array = values[:NT - NP]
-            subsub['Ek'] = k_array[::2]
-            subsub['Fk'] = k_array[1::2]
-            l_array = values[NT - NP:]
-            subsub['El'] = l_array[::2]
-            subsub['Fl'] = l_array[1::2]
-        elif LB == 5:
-            (_, _, LS, LB, NT, NE), values = get_list_record(file_obj)
-            subsub = {'LS': LS, 'LB': LB, 'NT': NT, 'NE': NE}
-            subsub['Ek'] = values[:NE]
-            # TODO: Reoder/reshape values for Fk,k' matrix
-            subsub['Fkk'] = values[NE:]
-        elif LB == 6:
-            (_, _, _, LB, NT, NER), values = get_list_record(file_obj)
-            NEC = (NT - 1)//NER
-            subsub = {'LB': LB, 'NT': NT, 'NER': NER, 'NEC': NEC}
-            subsub['ER'] = values[:NER]
-            subsub['EC'] = values[NER:NER + NEC]
-            # TODO: Reorder/reshape values for Fkl matrix
-            subsub['Fkl'] = values[NER + NEC:]
-        elif LB in (8, 9):
-            (_, _, LT, LB, NT, NP), values = get_list_record(file_obj)
-            subsub = {'LT': LT, 'LB': LB, 'NT': NT, 'NP': NP}
-            subsub['Ek'] = values[::2]
-            subsub['Fk'] = values[1::2]
-        else:
-            raise ValueError(f"Unrecognized {LB=}")
-
-        subsection['ni_subsections'].append(subsub)
+        # Each subsection is a single LIST record whose header gives LB
+        items, values = get_list_record(file_obj)
+        LB = items[3]
+        try:
+            parse_ni_subsection = _NI_SUBSECTION_PARSERS[LB]
+        except KeyError:
+            raise ValueError(f"Unrecognized {LB=}") from None
+        subsection['ni_subsections'].append(parse_ni_subsection(items, values))
 
     return subsection
 
 
+def _parse_ni_lb0_4(items: tuple, values: np.ndarray) -> dict:
+    """Parse an NI-type subsection with LB=0-4 (two energy-value tables)"""
+    _, _, LT, LB, NT, NP = items
+    subsub = {'LT': LT, 'LB': LB, 'NT': NT, 'NP': NP}
+    k_array = values[:NT - NP]
+    subsub['Ek'] = k_array[::2]
+    subsub['Fk'] = k_array[1::2]
+    l_array = values[NT - NP:]
+    subsub['El'] = l_array[::2]
+    subsub['Fl'] = l_array[1::2]
+    return subsub
+
+
+def _parse_ni_lb5(items: tuple, values: np.ndarray) -> dict:
+    """Parse an NI-type subsection with LB=5 (relative covariance matrix)"""
+    _, _, LS, LB, NT, NE = items
+    subsub = {'LS': LS, 'LB': LB, 'NT': NT, 'NE': NE}
+    subsub['Ek'] = values[:NE]
+    # TODO: Reoder/reshape values for Fk,k' matrix
+    subsub['Fkk'] = values[NE:]
+    return subsub
+
+
+def _parse_ni_lb6(items: tuple, values: np.ndarray) -> dict:
+    """Parse an NI-type subsection with LB=6 (rectangular covariance matrix)"""
+    _, _, _, LB, NT, NER = items
+    NEC = (NT - 1)//NER
+    subsub = {'LB': LB, 'NT': NT, 'NER': NER, 'NEC': NEC}
+    subsub['ER'] = values[:NER]
+    subsub['EC'] = values[NER:NER + NEC]
+    # TODO: Reorder/reshape values for Fkl matrix
+    subsub['Fkl'] = values[NER + NEC:]
+    return subsub
+
+
+def _parse_ni_lb8_9(items: tuple, values: np.ndarray) -> dict:
+    """Parse an NI-type subsection with LB=8 or 9 (variance contributions)"""
+    _, _, LT, LB, NT, NP = items
+    subsub = {'LT': LT, 'LB': LB, 'NT': NT, 'NP': NP}
+    subsub['Ek'] = values[::2]
+    subsub['Fk'] = values[1::2]
+    return subsub
+
+
+# Parsers for NI-type subsections for each value of LB
+_NI_SUBSECTION_PARSERS = {
+    0: _parse_ni_lb0_4,
+    1: _parse_ni_lb0_4,
+    2: _parse_ni_lb0_4,
+    3: _parse_ni_lb0_4,
+    4: _parse_ni_lb0_4,
+    5: _parse_ni_lb5,
+    6: _parse_ni_lb6,
+    8: _parse_ni_lb8_9,
+    9: _parse_ni_lb8_9,
+}
+
+
 def parse_mf33(file_obj: TextIO) -> dict:
     """Parse covariances of neutron cross sections from MF=33
 
@@ -46,20 +46,23 @@ def parse_mf34(file_obj: TextIO, MT: int) -> dict:
             if n == 0:
                 subsection['LCT'] = LCT
 
+            # Collect the (LS, LB, NT, NE) header of each LIST record so that
+            # each can be stored as a column
+            headers = np.empty((NI, 4), dtype=int)
+            values = []
+            for m in range(NI):
+                items, values_m = get_list_record(file_obj)
+                headers[m] = items[2:]
+                values.append(values_m)
             subsub = {
-                'LS': np.empty(NI),
-                'LB': np.empty(NI),
-                'NT': np.empty(NI),
-                'NE': np.empty(NI),
-                'Data': []
+                'LS': headers[:, 0],
+                'LB': headers[:, 1],
+                'NT': headers[:, 2],
+                'NE': headers[:, 3],
+                'Data': values
             }
-            for m in range(NI):
-                (_, _, LS, LB, NT, NE), values = get_list_record(file_obj)
-                subsub['LS'][m] = LS
-                subsub['LB'][m] = LS
-                subsub['NT'][m] = NT
-                subsub['NE'][m] = NE
-                subsub['Data'].append(values)
             subsection['subsubsections'].append(subsub)
 
+        data['subsections'].append(subsection)
+
     return data
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 from __future__ import annotations
+from collections.abc import MutableSequence
 from typing import TextIO
 from warnings import warn
 
@@ -39,8 +40,7 @@ def parse_mf4(file_obj: TextIO) -> dict:
             data['T'] = items[0]
             energy[i] = items[1]
             data['LT'] = items[2]
-            coefficients = np.array(al)
-            a_l.append(coefficients)
+            a_l.append(al)
         data['a_l'] = a_l
         data['E'] = energy
         return data
@@ -82,6 +82,70 @@ def parse_mf4(file_obj: TextIO) -> dict:
     return data
 
 
+class _LegendreCoefficients:
+    """Legendre coefficients that have not been turned into a series yet"""
+    __slots__ = ('coef',)
+
+    def __init__(self, coef):
+        self.coef = coef
+
+
+class _AngleDistributions(MutableSequence):
+    """Angular distributions that create Legendre series on first access
+
+    Apart from the deferred creation of the Legendre series, this behaves like
+    a list of the distributions.
+
+    Parameters
+    ----------
+    a_l
+        Legendre coefficients (excluding the zeroth-order coefficient) for each
+        incoming energy
+    tabulated
+        Tabulated distributions that follow the Legendre distributions
+
+    """
+
+    def __init__(self, a_l, tabulated=()):
+        self._items = [_LegendreCoefficients(c) for c in a_l]
+        self._items.extend(tabulated)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        item = self._items[i]
+        if isinstance(item, _LegendreCoefficients):
+            # The zeroth-order coefficient is implicitly one
+            item = self._items[i] = Legendre(np.concatenate(([1.0], item.coef)))
+        return item
+
+    def __setitem__(self, i, value):
+        self._items[i] = value
+
+    def __delitem__(self, i):
+        del self._items[i]
+
+    def insert(self, i, value):
+        self._items.insert(i, value)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, _AngleDistributions)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 class AngleDistribution:
     """Angle distribution as a function of incoming energy
 
@@ -97,7 +161,9 @@ class AngleDistribution:
     energy
         Incoming energies in eV at which distributions exist
     mu
-        Distribution of scattering cosines corresponding to each incoming energy
+        Distribution of scattering cosines corresponding to each incoming
+        energy. Legendre series are created when first accessed, but the
+        sequence otherwise behaves like a list.
 
     """
 
@@ -116,28 +182,16 @@ class AngleDistribution:
             mu = []
         elif LTT == 1 and LI == 0:
             energy = data['legendre']['E']
-            mu = []
-            for a_l in data['legendre']['a_l']:
-                coef = np.insert(a_l, 0, 1.0)
-                mu.append(Legendre(coef))
+            mu = _AngleDistributions(data['legendre']['a_l'])
         elif LTT == 2 and LI == 0:
             energy = data['tabulated']['E']
             mu = data['tabulated']['mu']
         elif LTT == 3 and LI == 0:
-            # Get Legendre first
-            energy_leg = data['legendre']['E']
-            mu_leg = []
-            for a_l in data['legendre']['a_l']:
-                coef = np.insert(a_l, 0, 1.0)
-                mu_leg.append(Legendre(coef))
-
-            # Then get tabulated
-            energy_tab = data['tabulated']['E']
-            mu_tab = data['tabulated']['mu']
-
-            # Combine
-            energy = np.hstack((energy_leg, energy_tab))
-            mu = mu_leg + mu_tab
+            # Legendre distributions at low energy followed by tabulated
+            # distributions at high energy
+            energy = np.hstack((data['legendre']['E'], data['tabulated']['E']))
+            mu = _AngleDistributions(data['legendre']['a_l'],
+                                     data['tabulated']['mu'])
 
         return cls(energy, mu)
 
@@ -19,19 +19,7 @@ def parse_mf5(file_obj: TextIO) -> dict:
         params, applicability = get_tab1_record(file_obj)
         subsection['LF'] = LF = params[3]
         subsection['p'] = applicability
-        if LF == 1:
-            dist = ArbitraryTabulated.dict_from_endf(file_obj, params)
-        elif LF == 5:
-            dist = GeneralEvaporation.dict_from_endf(file_obj, params)
-        elif LF == 7:
-            dist = MaxwellEnergy.dict_from_endf(file_obj, params)
-        elif LF == 9:
-            dist = Evaporation.dict_from_endf(file_obj, params)
-        elif LF == 11:
-            dist = WattEnergy.dict_from_endf(file_obj, params)
-        elif LF == 12:
-            dist = MadlandNix.dict_from_endf(file_obj, params)
-
+        dist = _energy_distribution_class(LF).dict_from_endf(file_obj, params)
         subsection['distribution'] = dist
         data['subsections'].append(subsection)
 
@@ -64,35 +52,13 @@ class EnergyDistribution(ABC):
 
         """
         LF = params[3]
-        if LF == 1:
-            return ArbitraryTabulated.from_endf(file_obj, params)
-        elif LF == 5:
-            return GeneralEvaporation.from_endf(file_obj, params)
-        elif LF == 7:
-            return MaxwellEnergy.from_endf(file_obj, params)
-        elif LF == 9:
-            return Evaporation.from_endf(file_obj, params)
-        elif LF == 11:
-            return WattEnergy.from_endf(file_obj, params)
-        elif LF == 12:
-            return MadlandNix.from_endf(file_obj, params)
+        return _energy_distribution_class(LF).from_endf(file_obj, params)
 
     @staticmethod
     def from_dict(subsection: dict):
         LF = subsection['LF']
         data = subsection['distribution']
-        if LF == 1:
-            return ArbitraryTabulated.from_dict(data)
-        elif LF == 5:
-            return GeneralEvaporation.from_dict(data)
-        elif LF == 7:
-            return MaxwellEnergy.from_dict(data)
-        elif LF == 9:
-            return Evaporation.from_dict(data)
-        elif LF == 11:
-            return WattEnergy.from_dict(data)
-        elif LF == 12:
-            return MadlandNix.from_dict(data)
+        return _energy_distribution_class(LF).from_dict(data)
 
 
 class ArbitraryTabulated(EnergyDistribution):
@@ -283,6 +249,11 @@ class MaxwellEnergy(EnergyDistribution):
         _, theta = get_tab1_record(file_obj)
         return {'U': params[0], 'theta': theta}
 
+    @classmethod
+    def from_endf(cls, file_obj: TextIO, params: list):
+        data = cls.dict_from_endf(file_obj, params)
+        return cls(data['theta'], data['U'])
+
     @classmethod
     def from_dict(cls, data: dict):
         return cls(data['theta'], data['U'])
@@ -489,6 +460,24 @@ class MadlandNix(EnergyDistribution):
         return cls(data['EFL'], data['EFH'], data['T_M'])
 
 
+# Energy distribution class for each LF value
+_LF_CLASSES = {
+    1: ArbitraryTabulated,
+    5: GeneralEvaporation,
+    7: MaxwellEnergy,
+    9: Evaporation,
+    11: WattEnergy,
+    12: MadlandNix,
+}
+
+
+def _energy_distribution_class(LF: int) -> type:
+    try:
+        return _LF_CLASSES[LF]
+    except KeyError:
+        raise ValueError(f"Unrecognized {LF=}") from None
+
+
 class LevelInelastic:
     r"""Level inelastic scattering
 
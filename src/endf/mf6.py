@@ -35,38 +35,10 @@ def parse_mf6(file_obj: TextIO) -> dict:
 
         p = {'ZAP': ZAP, 'AWP': AWP, 'LIP': LIP, 'LAW': LAW, 'y_i': y_i}
 
-        if LAW < 0:
-            # Distribution given elsewhere
-            pass
-        elif LAW == 0:
-            # No distribution given
-            pass
-        elif LAW == 1:
-            # Continuum energy-angle distribution
-            p['distribution'] = ContinuumEnergyAngle.dict_from_endf(file_obj)
-
-        elif LAW == 2:
-            # Discrete two-body scattering
-            p['distribution'] = DiscreteTwoBodyScattering.dict_from_endf(file_obj)
-        elif LAW == 3:
-            # Isotropic discrete emission
-            pass
-
-        elif LAW == 4:
-            # Discrete two-body recoil
-            pass
-
-        elif LAW == 5:
-            # Charged particle elastic scattering
-            p['distribution'] = ChargedParticleElasticScattering.dict_from_endf(file_obj)
-
-        elif LAW == 6:
-            # N-body phase-space distribution
-            p['distribution'] = NBodyPhaseSpace.dict_from_endf(file_obj)
-
-        elif LAW == 7:
-            # Laboratory energy-angle distribution
-            p['distribution'] = LaboratoryAngleEnergy.dict_from_endf(file_obj)
+        # LAW <= 0 (given elsewhere or absent) and LAW=3, 4 carry no data
+        dist_class = _LAW_CLASSES.get(LAW)
+        if dist_class is not None:
+            p['distribution'] = dist_class.dict_from_endf(file_obj)
 
         products.append(p)
 
@@ -91,9 +63,10 @@ class ContinuumEnergyAngle:
             _, E_i, ND, NA, NW, NEP = items
             dist = {'ND': ND, 'NA': NA, 'NW': NW, 'NEP': NEP}
             data['E'][i] = E_i
-            values = np.asarray(values)
-            values.shape = (NEP, NA + 2)
-            dist["E'"] = values[:, 0]
+            values = values.reshape(NEP, NA + 2)
+            # Outgoing energies are searched on their own, so give them a
+            # contiguous copy rather than a view strided across the rows
+            dist["E'"] = values[:, 0].copy()
             dist['b'] = values[:, 1:]
             data['distribution'].append(dist)
 
@@ -120,11 +93,12 @@ class DiscreteTwoBodyScattering:
         for i in range(NE):
             items, values = get_list_record(file_obj)
             _, E_i, LANG, _, NW, NL = items
-            dist = {'LANG': LANG, 'NW': NW, 'NL': NL}
+            dist = {'LANG': LANG, 'NW': NW, 'NL': NL, 'A_l': values}
             data['E'][i] = E_i
-            data['A_l'] = np.asarray(values)
             data['distribution'].append(dist)
 
+        return data
+
 
 class ChargedParticleElasticScattering:
     def __init__(self):
@@ -180,3 +154,13 @@ class LaboratoryAngleEnergy:
             data['distribution'].append(dist)
 
         return data
+
+
+# Product distribution class for each LAW value that carries data
+_LAW_CLASSES = {
+    1: ContinuumEnergyAngle,
+    2: DiscreteTwoBodyScattering,
+    5: ChargedParticleElasticScattering,
+    6: NBodyPhaseSpace,
+    7: LaboratoryAngleEnergy,
+}
@@ -3,8 +3,6 @@
 
 from typing import TextIO
 
-import numpy as np
-
 from .records import get_head_record, get_list_record, get_tab1_record, get_cont_record
 
 
@@ -166,15 +164,15 @@ def parse_mf8_mt457(file_obj: TextIO) -> dict:
         if LCOV not in (0, 2) and LCON != 0:
             items, values = get_list_record(file_obj)
             covar_continuous = {'LB': items[3]}
-            covar_continuous['Ek'] = np.array(values[::2])
-            covar_continuous['Fk'] = np.array(values[1::2])
+            covar_continuous['Ek'] = values[::2]
+            covar_continuous['Fk'] = values[1::2]
             spectrum['continuous_covariance'] = covar_continuous
 
         if LCOV not in (0, 1):
             (_, _, LS, LB, NE, NERP), values = get_list_record(file_obj)
             covar_discrete = {'LS': LS, 'LB': LB, 'NE': NE, 'NERP': NERP}
-            covar_discrete['Ek'] = np.array(values[:NERP])
-            covar_discrete['Fkk'] = np.array(values[NERP:])
+            covar_discrete['Ek'] = values[:NERP]
+            covar_discrete['Fkk'] = values[NERP:]
             # TODO: Reorder and shape Fkk based on the packing order described
             # in section 8.4 of the ENDF manual
             spectrum['discrete_covariance'] = covar_discrete
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2023 Paul Romano
 # SPDX-License-Identifier: MIT
 
+from functools import partial
 from typing import TextIO
 
 from .records import get_head_record, get_tab1_record
@@ -25,14 +26,16 @@ def parse_mf9_mf10(file_obj: TextIO, MF: int) -> dict:
     ZA, AWR, LIS, _, NS, _ = get_head_record(file_obj)
     data = {'ZA': ZA, 'AWR': AWR, 'LIS': LIS, 'NS': NS}
     data['levels'] = []
+    key = 'Y' if MF == 9 else 'sigma'
     for _ in range(NS):
         # Determine what the product is
         (QM, QI, IZAP, LFS), func = get_tab1_record(file_obj)
-        level_data = {'QM': QM, 'QI': QI, 'IZAP': IZAP, 'LFS': LFS}
-        if MF == 9:
-            level_data['Y'] = func
-        else:
-            level_data['sigma'] = func
+        level_data = {'QM': QM, 'QI': QI, 'IZAP': IZAP, 'LFS': LFS, key: func}
         data['levels'].append(level_data)
 
     return data
+
+
+# Parsers with the file number bound, used when dispatching on MF
+parse_mf9 = partial(parse_mf9_mf10, MF=9)
+parse_mf10 = partial(parse_mf9_mf10, MF=10)
@@ -3,6 +3,8 @@ from numpy.polynomial import Polynomial
 
 from .function import Tabulated1D
 
+__all__ = ['Product']
+
 
 class Product:
     """Secondary particle emitted in a nuclear reaction
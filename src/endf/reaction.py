@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 from copy import deepcopy
-from typing import List, Tuple
+from typing import Callable, List, Optional, Tuple
 from warnings import warn
 
 import numpy as np
@@ -19,6 +19,8 @@ from .product import Product
 from . import ace
 
 
+__all__ = ['Reaction', 'REACTION_NAME', 'REACTION_MT']
+
 REACTION_NAME = {
     1: '(n,total)', 2: '(n,elastic)', 4: '(n,level)',
     5: '(n,misc)', 11: '(n,2nd)', 16: '(n,2n)', 17: '(n,3n)',
@@ -214,7 +216,7 @@ def _get_fission_products_endf(material: Material, MT: int) -> Tuple[List[Produc
                 applicability = subsection['p']
                 if isinstance(yield_, Tabulated1D):
                     if np.all(applicability.y == applicability.y[0]):
-                        yield_.y *= applicability.y[0]
+                        yield_.y = yield_.y * applicability.y[0]
                     else:
                         # Get union energy grid and ensure energies are within
                         # interpolable range of both functions
@@ -228,7 +230,7 @@ def _get_fission_products_endf(material: Material, MT: int) -> Tuple[List[Produc
                 elif isinstance(yield_, Polynomial):
                     if len(yield_) == 1:
                         delayed_neutron.yield_ = deepcopy(applicability)
-                        delayed_neutron.yield_.y *= yield_.coef[0]
+                        delayed_neutron.yield_.y = applicability.y * yield_.coef[0]
                     else:
                         if np.all(applicability.y == applicability.y[0]):
                             yield_.coef[0] *= applicability.y[0]
@@ -296,11 +298,11 @@ def _get_activation_products(material: Material, MT: int, xs: Tabulated1D) -> Li
                 energy = np.union1d(production_xs.x, xs.x)
                 prod_xs = production_xs(energy)
                 neutron_xs = xs(energy)
-                idx = np.where(neutron_xs > 0)
 
-                # Calculate yield as ratio
-                yield_ = np.zeros_like(energy)
-                yield_[idx] = prod_xs[idx] / neutron_xs[idx]
+                # Calculate yield as ratio, leaving zero where the neutron
+                # cross section vanishes
+                yield_ = np.divide(prod_xs, neutron_xs, out=np.zeros_like(energy),
+                                   where=neutron_xs > 0)
                 yield_ = Tabulated1D(energy, yield_)
 
             p = Product(name, yield_)
@@ -361,6 +363,29 @@ class Reaction:
         self.q_massdiff = q_massdiff
         self.redundant = redundant
 
+    @property
+    def xs(self) -> dict:
+        if self._xs_factory is not None:
+            self._xs = self._xs_factory()
+            self._xs_factory = None
+        return self._xs
+
+    @xs.setter
+    def xs(self, xs: dict):
+        self._xs = xs
+        self._xs_factory = None
+
+    def _defer_xs(self, factory: Callable[[], dict]):
+        """Defer creating cross sections until they are first accessed
+
+        Parameters
+        ----------
+        factory
+            Function with no arguments that returns the cross section dictionary
+
+        """
+        self._xs_factory = factory
+
     @classmethod
     def from_endf(cls, MT: int, material: Material) -> Reaction:
         """Generate reaction from ENDF file
@@ -457,7 +482,9 @@ class Reaction:
         return cls(MT, xs, products, q_reaction, q_massdiff)
 
     @classmethod
-    def from_ace(cls, table: ace.Table, i_reaction: int):
+    def from_ace(cls, table: ace.Table, i_reaction: int,
+                 energy_grid: Optional[np.ndarray] = None,
+                 dtype: Optional[np.dtype] = None):
         """Generate incident neutron continuous-energy data from an ACE table
 
         Parameters
@@ -466,6 +493,13 @@ class Reaction:
             ACE table to read from
         i_reaction
             Index of the reaction in the ACE table
+        energy_grid
+            Energy grid of the ACE table in [eV]. When reading many reactions
+            from the same table, passing the grid avoids converting it again
+            for every reaction. If not given, it is read from the table.
+        dtype
+            Data type used to store energies and cross sections, e.g.,
+            numpy.float32. Defaults to the data type of the ACE table.
 
         Returns
         -------
@@ -474,7 +508,10 @@ class Reaction:
         """
         # Get nuclide energy grid
         n_grid = table.nxs[3]
-        grid = table.xss[table.jxs[1]:table.jxs[1] + n_grid]*EV_PER_MEV
+        if energy_grid is None:
+            grid = table.xss[table.jxs[1]:table.jxs[1] + n_grid]*EV_PER_MEV
+        else:
+            grid = energy_grid
 
         # Convert temperature to a string for indexing data
         strT = temperature_str(table.temperature)
@@ -502,15 +539,16 @@ class Reaction:
             # Read reaction cross section
             xs = table.xss[table.jxs[7] + loc + 1:table.jxs[7] + loc + 1 + n_energy]
 
-            # For damage energy production, convert to eV
+            # For damage energy production, convert to eV (without modifying
+            # the XSS array that xs is a view of)
             if MT == 444:
-                xs *= EV_PER_MEV
+                xs = xs*EV_PER_MEV
 
             # Warn about negative cross sections
             if np.any(xs < 0.0):
                 warn(f"Negative cross sections found for {MT=} in {table.name}.")
 
-            tabulated_xs = {strT: Tabulated1D(energy, xs)}
+            tabulated_xs = {strT: Tabulated1D(energy, xs, dtype=dtype)}
             rx = Reaction(MT, tabulated_xs, q_reaction=q_reaction)
 
             # ==================================================================
@@ -529,7 +567,7 @@ class Reaction:
             if np.any(elastic_xs < 0.0):
                 warn(f"Negative elastic scattering cross section found for {table.name}.")
 
-            xs = {strT: Tabulated1D(grid, elastic_xs)}
+            xs = {strT: Tabulated1D(grid, elastic_xs, dtype=dtype)}
 
             # No energy distribution for elastic scattering
             # TODO: Create product
@@ -4,7 +4,7 @@ from typing import TextIO, Tuple
 import numpy as np
 
 from .function import Tabulated1D, Tabulated2D
-from ._records import float_endf
+from ._records import float_array, cont_record
 
 ENDF_FLOAT_RE = re.compile(r'([\s\-\+]?\d*\.\d+)([\+\-]) ?(\d+)')
 
@@ -86,18 +86,10 @@ def get_cont_record(file_obj, skip_c=False):
         The six items within the CONT record
 
     """
-    line = file_obj.readline()
+    record = cont_record(file_obj.readline())
     if skip_c:
-        C1 = None
-        C2 = None
-    else:
-        C1 = float_endf(line[:11])
-        C2 = float_endf(line[11:22])
-    L1 = int_endf(line[22:33])
-    L2 = int_endf(line[33:44])
-    N1 = int_endf(line[44:55])
-    N2 = int_endf(line[55:66])
-    return (C1, C2, L1, L2, N1, N2)
+        return (None, None) + record[2:]
+    return record
 
 
 def get_head_record(file_obj):
@@ -114,14 +106,52 @@ def get_head_record(file_obj):
         The six items within the HEAD record
 
     """
-    line = file_obj.readline()
-    ZA = int(float_endf(line[:11]))
-    AWR = float_endf(line[11:22])
-    L1 = int_endf(line[22:33])
-    L2 = int_endf(line[33:44])
-    N1 = int_endf(line[44:55])
-    N2 = int_endf(line[55:66])
-    return (ZA, AWR, L1, L2, N1, N2)
+    ZA, AWR, L1, L2, N1, N2 = cont_record(file_obj.readline())
+    return (int(ZA), AWR, L1, L2, N1, N2)
+
+
+def get_values(file_obj: TextIO, n: int) -> np.ndarray:
+    """Return floating point values that fill consecutive lines of a record.
+
+    Parameters
+    ----------
+    file_obj : file-like object
+        ENDF-6 file to read from
+    n : int
+        Number of values to read, six per line
+
+    Returns
+    -------
+    numpy.ndarray
+        The values
+
+    """
+    # Read all lines at once and convert them in compiled code rather than
+    # converting each field separately
+    text = ''.join([file_obj.readline() for _ in range((n + 5)//6)])
+    return float_array(text, n)
+
+
+def get_regions(file_obj: TextIO, n_regions: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the interpolation regions of a TAB1 or TAB2 record.
+
+    Parameters
+    ----------
+    file_obj : file-like object
+        ENDF-6 file to read from
+    n_regions : int
+        Number of interpolation regions, three per line
+
+    Returns
+    -------
+    numpy.ndarray
+        Breakpoints for each region
+    numpy.ndarray
+        Interpolation scheme for each region
+
+    """
+    values = get_values(file_obj, 2*n_regions)
+    return values.astype(int).reshape(-1, 2).T.copy()
 
 
 def get_list_record(file_obj: TextIO) -> Tuple[list, np.ndarray]:
@@ -145,14 +175,7 @@ def get_list_record(file_obj: TextIO) -> Tuple[list, np.ndarray]:
     NPL = items[4]
 
     # read items
-    b = np.empty(NPL)
-    for i in range((NPL - 1)//6 + 1):
-        line = file_obj.readline()
-        n = min(6, NPL - 6*i)
-        for j in range(n):
-            b[6*i + j] = float_endf(line[11*j:11*(j + 1)])
-
-    return (items, b)
+    return (items, get_values(file_obj, NPL))
 
 
 def get_tab1_record(file_obj):
@@ -172,40 +195,18 @@ def get_tab1_record(file_obj):
 
     """
     # Determine how many interpolation regions and total points there are
-    line = file_obj.readline()
-    C1 = float_endf(line[:11])
-    C2 = float_endf(line[11:22])
-    L1 = int_endf(line[22:33])
-    L2 = int_endf(line[33:44])
-    n_regions = int_endf(line[44:55])
-    n_pairs = int_endf(line[55:66])
+    C1, C2, L1, L2, n_regions, n_pairs = cont_record(file_obj.readline())
     params = [C1, C2, L1, L2]
 
     # Read the interpolation region data, namely NBT and INT
-    breakpoints = np.zeros(n_regions, dtype=int)
-    interpolation = np.zeros(n_regions, dtype=int)
-    m = 0
-    for i in range((n_regions - 1)//3 + 1):
-        line = file_obj.readline()
-        to_read = min(3, n_regions - m)
-        for j in range(to_read):
-            breakpoints[m] = int_endf(line[0:11])
-            interpolation[m] = int_endf(line[11:22])
-            line = line[22:]
-            m += 1
+    breakpoints, interpolation = get_regions(file_obj, n_regions)
 
     # Read tabulated pairs x(n) and y(n)
-    x = np.zeros(n_pairs)
-    y = np.zeros(n_pairs)
-    m = 0
-    for i in range((n_pairs - 1)//3 + 1):
-        line = file_obj.readline()
-        to_read = min(3, n_pairs - m)
-        for j in range(to_read):
-            x[m] = float_endf(line[:11])
-            y[m] = float_endf(line[11:22])
-            line = line[22:]
-            m += 1
+    # The pairs are only referenced by the new function, so they can be made
+    # read-only here rather than copied again by Tabulated1D
+    xy = get_values(file_obj, 2*n_pairs).reshape(-1, 2).T.copy()
+    xy.flags.writeable = False
+    x, y = xy
 
     return params, Tabulated1D(x, y, breakpoints, interpolation)
 
@@ -216,21 +217,35 @@ def get_tab2_record(file_obj):
     n_regions = params[4]
 
     # Read the interpolation region data, namely NBT and INT
-    breakpoints = np.zeros(n_regions, dtype=int)
-    interpolation = np.zeros(n_regions, dtype=int)
-    m = 0
-    for _ in range((n_regions - 1)//3 + 1):
-        line = file_obj.readline()
-        to_read = min(3, n_regions - m)
-        for _ in range(to_read):
-            breakpoints[m] = int(line[0:11])
-            interpolation[m] = int(line[11:22])
-            line = line[22:]
-            m += 1
+    breakpoints, interpolation = get_regions(file_obj, n_regions)
 
     return params, Tabulated2D(breakpoints, interpolation)
 
 
+def _int_fields(chars: np.ndarray) -> np.ndarray:
+    """Convert right-justified ENDF integer fields to integers.
+
+    Parameters
+    ----------
+    chars : numpy.ndarray
+        ASCII codes with the characters of each field along the last axis.
+        Blank fields are converted to zero.
+
+    Returns
+    -------
+    numpy.ndarray
+        The integer in each field
+
+    """
+    digits = chars.astype(np.int64) - ord('0')
+    is_digit = (digits >= 0) & (digits <= 9)
+    values = np.zeros(chars.shape[:-1], dtype=np.int64)
+    for k in range(chars.shape[-1]):
+        values = np.where(is_digit[..., k], 10*values + digits[..., k], values)
+    negative = (chars == ord('-')).any(axis=-1)
+    return np.where(negative, -values, values)
+
+
 def get_intg_record(file_obj):
     """
     Return data from an INTG record in an ENDF-6 file. Used to store the
@@ -254,21 +269,27 @@ def get_intg_record(file_obj):
     NROW_RULES = {2: 18, 3: 12, 4: 11, 5: 9, 6: 8}
     nrow = NROW_RULES[ndigit]
 
-    # read lines and build correlation matrix
+    # Convert the fixed-width integer fields of all lines at once
+    width = 11 + nrow*(ndigit + 1)
+    text = ''.join(file_obj.readline()[:width].ljust(width)
+                   for _ in range(nlines))
+    chars = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    chars = chars.reshape(nlines, width)
+    ii = _int_fields(chars[:, :5]) - 1  # -1 to account for 0 indexing
+    jj = _int_fields(chars[:, 5:10]) - 1
+    elements = _int_fields(
+        chars[:, 11:].reshape(nlines, nrow, ndigit + 1))
+
+    # Only elements below the diagonal are given; zero means no correlation
+    rows = np.broadcast_to(ii[:, None], elements.shape)
+    cols = jj[:, None] + np.arange(nrow)
+    mask = (cols < rows) & (elements != 0)
+    elements = elements[mask]
+
+    # build correlation matrix
     corr = np.identity(npar)
-    for i in range(nlines):
-        line = file_obj.readline()
-        ii = int_endf(line[:5]) - 1  # -1 to account for 0 indexing
-        jj = int_endf(line[5:10]) - 1
-        factor = 10**ndigit
-        for j in range(nrow):
-            if jj+j >= ii:
-                break
-            element = int_endf(line[11+(ndigit+1)*j:11+(ndigit+1)*(j+1)])
-            if element > 0:
-                corr[ii, jj] = (element+0.5)/factor
-            elif element < 0:
-                corr[ii, jj] = (element-0.5)/factor
+    corr[rows[mask], cols[mask]] = \
+        (elements + 0.5*np.sign(elements))/10**ndigit
 
     # Symmetrize the correlation matrix
     corr = corr + corr.T - np.diag(corr.diagonal())
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: Paul Romano
+# SPDX-License-Identifier: MIT
+
+import pytest
+from endf.data import gnds_name, zam, temperature_str, ATOMIC_SYMBOL, \
+    ATOMIC_NUMBER
+
+
+def test_gnds_name():
+    assert gnds_name(1, 1) == 'H1'
+    assert gnds_name(0, 1) == 'n1'
+    assert gnds_name(95, 242, 1) == 'Am242_m1'
+
+
+@pytest.mark.parametrize('Z', [-1, 119, 200])
+def test_gnds_name_invalid(Z):
+    with pytest.raises(KeyError):
+        gnds_name(Z, 0)
+
+
+def test_zam():
+    assert zam('H1') == (1, 1, 0)
+    assert zam('U235') == (92, 235, 0)
+    assert zam('Am242_m1') == (95, 242, 1)
+    assert zam('Tc99_e2') == (43, 99, 2)
+
+
+def test_zam_roundtrip():
+    for Z, A, m in [(1, 2, 0), (26, 56, 0), (95, 242, 1), (118, 294, 0)]:
+        assert zam(gnds_name(Z, A, m)) == (Z, A, m)
+
+
+@pytest.mark.parametrize('name', ['', 'U', '235', 'U235_', 'U235_x1',
+                                  'U235_m', 'U235m1', 'U235_m1_m2'])
+def test_zam_invalid(name):
+    with pytest.raises(ValueError, match='GNDS format'):
+        zam(name)
+
+
+def test_zam_unknown_symbol():
+    with pytest.raises(ValueError, match='element symbol'):
+        zam('Xx12')
+
+
+def test_temperature_str():
+    assert temperature_str(293.6) == '294K'
+    assert temperature_str(600.0) == '600K'
+    assert temperature_str(0) == '0K'
+
+
+def test_constants_read_only():
+    assert ATOMIC_NUMBER[ATOMIC_SYMBOL[92]] == 92
+    with pytest.raises(TypeError):
+        ATOMIC_SYMBOL[0] = 'X'
@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: Paul Romano
+# SPDX-License-Identifier: MIT
+
+import pickle
+
+import numpy as np
+from pytest import approx, raises
+from endf import Tabulated1D
+
+
+def test_interpolation_schemes():
+    x = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    y = [1.0, 2.0, 4.0, 8.0, 16.0, 32.0]
+    f = Tabulated1D(x, y, [2, 3, 4, 5, 6], [1, 2, 3, 4, 5])
+    points = np.array([1.5, 2.5, 3.5, 4.5, 5.5])
+    expected = [
+        1.0,
+        3.0,
+        4.0 + 4.0*np.log(3.5/3.0)/np.log(4.0/3.0),
+        8.0*np.exp(0.5*np.log(2.0)),
+        16.0*np.exp(np.log(5.5/5.0)/np.log(6.0/5.0)*np.log(2.0))
+    ]
+    assert f(points) == approx(expected)
+    assert [f(xi) for xi in points] == approx(expected)
+
+
+def test_out_of_range():
+    # Points outside the tabulated range take the value at the nearest end
+    f = Tabulated1D([1.0, 2.0], [3.0, 5.0])
+    assert f(0.5) == 3.0
+    assert f(2.5) == 5.0
+    assert f(np.array([0.5, 2.5])) == approx([3.0, 5.0])
+
+    g = Tabulated1D([1.0, 2.0, 3.0], [3.0, 5.0, 4.0], [2, 3], [2, 5])
+    points = np.array([0.5, 1.5, 2.5, 3.5])
+    assert g(points) == approx([g(xi) for xi in points])
+    assert g(points)[[0, 3]] == approx([3.0, 4.0])
+
+    # NaN propagates rather than being set to zero
+    assert np.isnan(f(np.array([np.nan, 1.5]))[0])
+    assert np.isnan(g(np.array([np.nan, 1.5]))[0])
+
+    # Large tables clamp the same way at both ends
+    x = np.linspace(1.0, 2.0, 1000)
+    h = Tabulated1D(x, x + 1.0, [1000], [5])
+    assert h(np.array([3.0, 0.0, 1.5])) == approx([3.0, 2.0, 2.5])
+
+
+def test_large_table_unsorted():
+    # Large tables search for bins differently depending on whether the
+    # points are sorted
+    x = np.logspace(0, 6, 1000)
+    f = Tabulated1D(x, np.sqrt(x))
+    points = np.random.default_rng(1).uniform(1.0, 1e6, 500)
+    assert f(points) == approx(np.interp(points, x, np.sqrt(x)))
+    assert f(np.sort(points)) == approx(np.interp(np.sort(points), x, np.sqrt(x)))
+
+
+def test_read_only_values():
+    # Lookup tables are cached from x and y, so they can't be changed in place
+    x = np.logspace(0, 6, 1000)
+    f = Tabulated1D(x, np.sqrt(x))
+    points = np.random.default_rng(1).uniform(1.0, 1e6, 500)
+    f(points)
+    with raises(ValueError):
+        f.x[:] = 2*x
+    with raises(ValueError):
+        f.y *= 2.0
+
+    # Assigning new arrays rebuilds the lookup tables
+    f.x = 2*x
+    assert f(points) == approx(np.interp(points, 2*x, np.sqrt(x)))
+    assert not pickle.loads(pickle.dumps(f)).x.flags.writeable
+
+
+def test_source_array_changed():
+    # Changing the array a function was created from doesn't affect it
+    x = np.linspace(1.0, 3.0, 300)
+    y = x**2
+    g = Tabulated1D(x, y, [300], [4])
+    y[:] = 1.0
+    assert g(np.array([2.6])) == approx([g(2.6)])
+    assert g(2.6) == approx(2.6**2, rel=1e-4)
+
+
+def test_slopes_after_update():
+    # Cached slopes must follow a new x; in-place edits are rejected
+    x = np.linspace(1.0, 3.0, 300)
+    g = Tabulated1D(x, x**2, [300], [4])
+    assert g(np.array([2.6])) == approx([g(2.6)])
+    with raises(ValueError):
+        g.x[:] = g.x*2
+    g.x = g.x*2
+    assert g(np.array([2.6])) == approx([g(2.6)])
+    assert g(np.array([2.6])) == approx([np.interp(1.3, x, x**2)], rel=1e-4)
+
+
+def test_pickle():
+    f = Tabulated1D([1.0, 2.0, 3.0], [1.0, 4.0, 9.0], [3], [5])
+    assert f(np.array([1.5])) == approx([2.25])
+    assert f(1.5) == approx(2.25)
+    g = pickle.loads(pickle.dumps(f))
+    assert g._slope_cache == {}
+    assert g(2.5) == approx(6.25)
+    assert g(np.array([2.5])) == approx([6.25])
+
+
+def test_scalar_after_update():
+    f = Tabulated1D([1.0, 2.0, 3.0], [1.0, 4.0, 9.0])
+    assert f(1.5) == approx(2.5)
+    f.y = np.array([2.0, 8.0, 18.0])
+    assert f(1.5) == approx(5.0)
+    f.interpolation = np.array([1])
+    assert f(1.5) == approx(2.0)
+
+    # The interpolator can't be left holding arrays that were changed in place
+    with raises(ValueError):
+        f.y[1] = 0.0
+    assert f(1.5) == approx(2.0)
+    assert f(np.array([1.5])) == approx([2.0])
+
+
+def test_shared_regions():
+    f = Tabulated1D([1.0, 2.0, 3.0], [1.0, 4.0, 9.0])
+    g = Tabulated1D(np.array([1.0, 2.0, 3.0]), [2.0, 5.0, 7.0], [3], [2])
+    assert f.breakpoints is g.breakpoints
+    assert f.interpolation is g.interpolation
+    assert not f.breakpoints.flags.writeable
+
+
+def test_integral():
+    x = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    y = [1.0, 2.0, 4.0, 8.0, 16.0, 32.0]
+    f = Tabulated1D(x, y, [2, 3, 4, 5, 6], [1, 2, 3, 4, 5])
+    areas = [
+        1.0,
+        3.0,
+        4.0 + 4.0*(4.0*np.log(4.0/3.0) - 1.0)/np.log(4.0/3.0),
+        8.0/np.log(2.0),
+        16.0*5.0/(1.0 + np.log(2.0)/np.log(6.0/5.0))*(2.0*6.0/5.0 - 1.0)
+    ]
+    assert f.integral() == approx(np.concatenate(([0.0], np.cumsum(areas))))
@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: Paul Romano
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+import pytest
+from pytest import approx
+from endf import ace, IncidentNeutron
+
+
+@pytest.fixture
+def table():
+    # Minimal continuous-energy ACE table with elastic scattering and a single
+    # capture reaction. Arrays are padded at the front to allow 1-based
+    # indexing as in the ACE format specification.
+    energy = [1e-11, 1.0, 20.0]
+    total = [10.0, 5.0, 4.0]
+    absorption = [2.0, 1.0, 0.5]
+    elastic = [8.0, 4.0, 3.5]
+    heating = [1.0, 2.0, 3.0]
+    xss = np.array([0.0, *energy, *total, *absorption, *elastic, *heating,
+                    102, 6.0, 1, 1, 3, *absorption])
+    nxs = np.zeros(17, dtype=int)
+    nxs[3] = 3
+    nxs[4] = 1
+    jxs = np.zeros(33, dtype=int)
+    jxs[1], jxs[3], jxs[4], jxs[6], jxs[7] = 1, 16, 17, 18, 19
+    return ace.Table('92235.80c', 235.0, 2.53e-8, [], nxs, jxs, xss)
+
+
+def test_from_ace(table):
+    data = IncidentNeutron.from_ace(table)
+    assert data.name == 'U235'
+    assert sorted(data.reactions) == [1, 2, 101, 102, 301]
+
+    strT = next(iter(data[1].xs))
+    assert data[1].xs[strT].x == approx([1e-5, 1e6, 2e7])
+    assert data[2].xs[strT].y == approx([8.0, 4.0, 3.5])
+    assert data[102].xs[strT].x == approx([1e-5, 1e6, 2e7])
+
+    # Heating is only computed once it is accessed
+    assert data[301]._xs_factory is not None
+    assert data[301].xs[strT].y == approx([1e7, 1e7, 1.2e7])
+    assert data[301]._xs_factory is None
+    assert data[101].redundant
+    assert not data[102].redundant
+
+
+def test_from_ace_float32(table):
+    data = IncidentNeutron.from_ace(table, dtype=np.float32)
+    strT = next(iter(data[1].xs))
+    for rx in data:
+        assert rx.xs[strT].x.dtype == np.float32
+        assert rx.xs[strT].y.dtype == np.float32
+
+    # Shared energy grid is only converted once
+    assert data[2].xs[strT].x is data[1].xs[strT].x
+
+    total = data[1].xs[strT]
+    assert total(5e5) == approx(7.5)
+    assert total(np.array([5e5])) == approx([7.5])
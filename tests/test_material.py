@@ -38,6 +38,12 @@ def test_section_data(am244):
     assert metadata['ZSYMAM'].strip() == '95-Am-244'
     assert metadata['EMAX'] == pytest.approx(20.0e6)
 
+    # Fission energy release components have a (value, uncertainty) row for
+    # each polynomial order
+    energy_release = am244.section_data[1, 458]
+    assert energy_release['EFR'].shape == (energy_release['NPLY'] + 1, 2)
+    assert energy_release['EFR'][0] == pytest.approx([1.805606e8, 9.930834e6])
+
     # Spot check cross section data in MF=4
     capture = am244.section_data[3, 102]
     assert capture['QM'] == pytest.approx(6052990.0)
@@ -46,6 +52,34 @@ def test_section_data(am244):
     assert am244[3, 102] is am244.section_data[3, 102]
 
 
+def test_lazy_sections(am244):
+    # Sections are only parsed once they are accessed
+    assert (3, 102) in am244
+    assert (3, 102) not in am244._section_data
+    capture = am244[3, 102]
+    assert am244[3, 102] is capture
+
+    # Accessing section_data parses everything, in file order
+    assert list(am244.section_data) == [
+        key for key in am244.sections if key in am244]
+
+
+def test_failed_section_can_be_retried(am244):
+    # A section whose parser raises stays available for another attempt
+    parser = am244._parsers[3, 102]
+
+    def broken(file_obj):
+        raise ValueError('broken section')
+
+    am244._parsers[3, 102] = broken
+    with pytest.raises(ValueError):
+        am244[3, 102]
+    assert (3, 102) in am244
+
+    am244._parsers[3, 102] = parser
+    assert 'sigma' in am244[3, 102]
+
+
 def test_contains(am244):
     assert (3, 102) in am244
     assert (102, 3) not in am244
@@ -59,3 +93,33 @@ def test_repr(am244):
 def test_interpret(am244):
     am244_high_level = am244.interpret()
     assert isinstance(am244_high_level, endf.IncidentNeutron)
+
+
+def test_get_materials(tmp_path):
+    # Create a tape with two copies of the same material
+    text = Path(__file__).with_name('n-095_Am_244.endf').read_text()
+    tpid, *lines = text.splitlines(keepends=True)
+    tend = lines.pop()
+    filename = tmp_path / 'tape.endf'
+    filename.write_text(tpid + 2*''.join(lines) + tend)
+
+    materials = endf.get_materials(filename)
+    assert len(materials) == 2
+    for mat in materials:
+        assert mat.MAT == 9552
+        assert mat.sections == materials[0].sections
+
+    # Materials read serially are parsed when first accessed
+    assert not materials[0]._section_data
+
+    # Parsing materials in parallel parses every section in the workers and
+    # gives the same result
+    materials = endf.get_materials(filename, max_workers=2)
+    assert len(materials) == 2
+    for mat in materials:
+        assert mat.MAT == 9552
+        assert not mat._parsers
+        assert list(mat._section_data) == [
+            key for key in mat.sections if key in mat]
+        assert mat.sections == materials[0].sections
+        assert mat[3, 1]['sigma'].y == pytest.approx(materials[0][3, 1]['sigma'].y)
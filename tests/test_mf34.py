@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: Paul Romano
+# SPDX-License-Identifier: MIT
+
+from io import StringIO
+
+from pytest import approx
+
+from endf.mf34 import parse_mf34
+
+
+def test_parse_mf34():
+    text = (
+        " 9.524400+4 2.419680+2          0          1          0          19552342\n"
+        " 0.000000+0 0.000000+0          0          2          1          19552342\n"
+        " 0.000000+0 0.000000+0          1          1          0          29552342\n"
+        " 0.000000+0 0.000000+0          1          5          3          29552342\n"
+        " 1.000000-5 2.000000+7 1.000000-2                                 9552342\n"
+        " 0.000000+0 0.000000+0          0          1          3          29552342\n"
+        " 1.000000-5 2.000000+7 3.000000-2                                 9552342\n"
+    )
+    data = parse_mf34(StringIO(text), 2)
+    subsection, = data['subsections']
+    assert subsection['NSS'] == 1
+    assert subsection['NI'] == approx([2])
+
+    # LIST headers are stored as one column per field
+    subsub, = subsection['subsubsections']
+    assert list(subsub['LS']) == [1, 0]
+    assert list(subsub['LB']) == [5, 1]
+    assert list(subsub['NT']) == [3, 3]
+    assert list(subsub['NE']) == [2, 2]
+    assert subsub['Data'][0] == approx([1.0e-5, 2.0e7, 0.01])
+    assert subsub['Data'][1] == approx([1.0e-5, 2.0e7, 0.03])
@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: Paul Romano
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+from numpy.polynomial import Legendre
+from pytest import approx
+
+from endf.function import Tabulated1D
+from endf.mf4 import AngleDistribution
+
+
+def test_angle_distribution_legendre_and_tabulated():
+    tabulated = Tabulated1D([-1.0, 1.0], [0.5, 0.5])
+    data = {
+        'LTT': 3, 'LI': 0,
+        'legendre': {'E': np.array([1.0, 2.0]),
+                     'a_l': [np.array([0.1]), np.array([0.2, 0.3])]},
+        'tabulated': {'E': np.array([3.0]), 'mu': [tabulated]},
+    }
+    dist = AngleDistribution.from_dict(data)
+    assert dist.energy == approx([1.0, 2.0, 3.0])
+    assert len(dist.mu) == 3
+
+    # Legendre series include the implicit zeroth-order coefficient and are
+    # only created once
+    assert isinstance(dist.mu[1], Legendre)
+    assert dist.mu[1].coef == approx([1.0, 0.2, 0.3])
+    assert dist.mu[1] is dist.mu[-2]
+    assert dist.mu[-1] is tabulated
+    assert list(dist.mu)[0].coef == approx([1.0, 0.1])
+
+
+def test_angle_distribution_list_behavior():
+    data = {
+        'LTT': 1, 'LI': 0,
+        'legendre': {'E': np.array([1.0, 2.0]),
+                     'a_l': [np.array([0.1]), np.array([0.2])]},
+    }
+    dist = AngleDistribution.from_dict(data)
+    tabulated = Tabulated1D([-1.0, 1.0], [0.5, 0.5])
+
+    # The distributions can be modified and compared like a list
+    dist.mu.append(tabulated)
+    assert len(dist.mu) == 3
+    assert dist.mu[-1] is tabulated
+    dist.mu.insert(0, tabulated)
+    assert dist.mu[1].coef == approx([1.0, 0.1])
+    del dist.mu[0]
+    assert dist.mu == [dist.mu[0], dist.mu[1], tabulated]
+    assert dist.mu + [tabulated] == [dist.mu[0], dist.mu[1], tabulated, tabulated]
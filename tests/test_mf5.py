@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: Paul Romano
+# SPDX-License-Identifier: MIT
+
+from io import StringIO
+
+import pytest
+
+from endf.function import Tabulated1D
+from endf.mf5 import EnergyDistribution, MaxwellEnergy
+
+
+def test_energy_distribution_dispatch():
+    theta = Tabulated1D([1.0, 2.0], [1.3e6, 1.4e6])
+    subsection = {'LF': 7, 'distribution': {'U': 1.0e5, 'theta': theta}}
+    dist = EnergyDistribution.from_dict(subsection)
+    assert isinstance(dist, MaxwellEnergy)
+    assert dist.u == 1.0e5
+
+    with pytest.raises(ValueError, match='LF=3'):
+        EnergyDistribution.from_dict({'LF': 3, 'distribution': {}})
+
+
+def test_maxwell_from_endf():
+    text = (
+        " 0.000000+0 0.000000+0          0          0          1          29437 5 18\n"
+        "          2          2                                            9437 5 18\n"
+        " 1.000000-5 1.300000+6 2.000000+7 1.400000+6                      9437 5 18\n"
+    )
+    dist = EnergyDistribution.from_endf(StringIO(text), [1.0e5, 0.0, 0, 7, 1, 2])
+    assert isinstance(dist, MaxwellEnergy)
+    assert dist.theta(2.0e7) == pytest.approx(1.4e6)
@@ -0,0 +1,26 @@
+# SPDX-FileCopyrightText: Paul Romano
+# SPDX-License-Identifier: MIT
+
+from io import StringIO
+
+from pytest import approx
+
+from endf.mf6 import DiscreteTwoBodyScattering
+
+
+def test_discrete_two_body_scattering():
+    text = (
+        " 0.000000+0 0.000000+0          0          0          1          29437 6  2\n"
+        "          2          2                                            9437 6  2\n"
+        " 0.000000+0 1.000000+6          0          0          2          19437 6  2\n"
+        " 1.000000-1 2.000000-1                                            9437 6  2\n"
+        " 0.000000+0 2.000000+6          0          0          1          19437 6  2\n"
+        " 3.000000-1                                                       9437 6  2\n"
+    )
+    data = DiscreteTwoBodyScattering.dict_from_endf(StringIO(text))
+    assert data['E'] == approx([1.0e6, 2.0e6])
+
+    # Each incident energy keeps its own Legendre coefficients
+    first, second = data['distribution']
+    assert first['A_l'] == approx([0.1, 0.2])
+    assert second['A_l'] == approx([0.3])
@@ -1,8 +1,12 @@
 # SPDX-FileCopyrightText: Paul Romano
 # SPDX-License-Identifier: MIT
 
-from pytest import approx
-from endf._records import float_endf
+from io import StringIO
+
+import numpy as np
+from pytest import approx, raises
+from endf._records import float_endf, float_array, cont_record, split_material
+from endf.records import get_intg_record
 
 
 def test_float_sign():
@@ -51,3 +55,58 @@ def test_float_empty():
 
 def test_float_buffer_size():
     assert float_endf('9.876540000000000') == approx(9.87654)
+
+
+def test_float_array():
+    lines = (' 1.000000+0 2.000000+0 3.000000+0 4.000000+0 5.000000+0 6.000000+0 125 3  1\n'
+             ' 7.000000+0-8.000000-1\n')
+    assert float_array(lines, 8) == approx([1., 2., 3., 4., 5., 6., 7., -0.8])
+    assert float_array(lines, 3) == approx([1., 2., 3.])
+
+    # Fields missing from short lines are zero
+    assert float_array(lines, 9) == approx([1., 2., 3., 4., 5., 6., 7., -0.8, 0.])
+
+
+def test_cont_record():
+    line = ' 9.524400+4 2.419680+2          0          1         54         27\n'
+    assert cont_record(line) == (approx(95244.0), approx(241.968), 0, 1, 54, 27)
+    assert cont_record(' 1.0\n') == (1.0, 0.0, 0, 0, 0, 0)
+    with raises(ValueError):
+        cont_record(' 1.0        2.0        1.5')
+
+
+def test_intg_record():
+    # NDIGIT=3 with four parameters; fields past the diagonal are ignored
+    text = (
+        ' 0.000000+0 0.000000+0          3          4          2          0\n'
+        '    2    1  500                                                    \n'
+        '    4    1 -250   0 999 123                                        \n'
+    )
+    corr = get_intg_record(StringIO(text))
+    assert corr == approx(np.array([
+        [1.0, 0.5005, 0.0, -0.2505],
+        [0.5005, 1.0, 0.0, 0.0],
+        [0.0, 0.0, 1.0, 0.9995],
+        [-0.2505, 0.0, 0.9995, 1.0],
+    ]))
+
+
+def test_split_material():
+    def record(MAT, MF, MT, text=''):
+        return f'{text:66}{MAT:4}{MF:2}{MT:3}\n'
+
+    lines = [
+        record(125, 1, 451, ' 1.001000+3'),
+        record(125, 1, 451, ' Hydrogen évaluation'),
+        record(125, 1, 0),
+        record(125, 0, 0),
+        record(125, 3, 1, ' 1.001000+3'),
+        record(125, 3, 0),
+        record(125, 0, 0),
+        record(0, 0, 0),
+    ]
+    MAT, sections = split_material(''.join(lines))
+    assert MAT == 125
+    assert list(sections) == [(1, 451), (3, 1)]
+    assert sections[1, 451] == lines[0] + lines[1]
+    assert sections[3, 1] == lines[4]
@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: Paul Romano
+# SPDX-License-Identifier: MIT
+
+import importlib
+import importlib.metadata
+
+import endf
+
+
+def test_version_without_metadata(monkeypatch):
+    # Importing endf should not need to query installed package metadata
+    def version(name):
+        raise RuntimeError("importlib.metadata.version should not be called")
+
+    monkeypatch.setattr(importlib.metadata, 'version', version)
+    importlib.reload(endf)
+    assert isinstance(endf.__version__, str)
+
+
+def test_package_namespace():
+    # Names that used to come in through star-imports are still available
+    for name in ('IncidentNeutron', 'AngleDistribution', 'EnergyDistribution',
+                 'Polynomial', 'gnds_name', 'SUM_RULES', 'EV_PER_MEV',
+                 'parse_mf3', 'parse_mf7_mt451'):
+        assert name in dir(endf)
+        assert getattr(endf, name) is not None
+
+
+def test_lazy_submodules():
+    for name in ('ace', 'incident_neutron', 'reaction'):
+        module = getattr(endf, name)
+        assert module.__name__ == f'endf.{name}'